@@ -36,7 +36,7 @@ class ConfigCog(commands.Cog):
             self.bot.tree.add_command(link_reaction_config)
             logger.info("Registered link-reaction-config command")
         except Exception as e:
-            logger.error(f"Failed to register link-reaction-config command: {str(e)}")
+            logger.exception("Failed to register link-reaction-config command: %s", e)
     
     async def cog_load(self):
         """
@@ -49,19 +49,19 @@ class ConfigCog(commands.Cog):
             setup_pinger_config(self.bot)
             logger.info("Setup pinger-config command")
         except Exception as e:
-            logger.error(f"Failed to setup pinger-config command: {str(e)}")
+            logger.exception("Failed to setup pinger-config command: %s", e)
         
         try:
             setup_reaction_forward_config(self.bot)
             logger.info("Setup reaction-forward-config command")
         except Exception as e:
-            logger.error(f"Failed to setup reaction-forward-config command: {str(e)}")
+            logger.exception("Failed to setup reaction-forward-config command: %s", e)
         
         try:
             setup_mod_config(self.bot)
             logger.info("Setup mod-config command")
         except Exception as e:
-            logger.error(f"Failed to setup mod-config command: {str(e)}")
+            logger.exception("Failed to setup mod-config command: %s", e)
 
 async def setup(bot):
     """
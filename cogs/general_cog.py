@@ -37,16 +37,11 @@ class GeneralCog(commands.Cog):
         """
         Simple ping command to check bot latency.
         """
-        # Calculate latency
-        import time
-        start_time = time.time()
-        await interaction.response.defer(ephemeral=False)
-        end_time = time.time()
-        
-        latency = round((end_time - start_time) * 1000)
+        # Use the gateway latency so the reply takes a single response call
+        latency = round(self.bot.latency * 1000)
         
         # Send response
-        await interaction.followup.send(f"Pong! 🏓 Latency: {latency}ms")
+        await interaction.response.send_message(f"Pong! 🏓 Latency: {latency}ms")
         
         logger.debug(f"Ping command executed by {interaction.user} with latency {latency}ms")
     
@@ -1,13 +1,37 @@
 """
 Configuration package for the Discord bot.
 Exposes all configuration modules and their instances.
+
+Instances are loaded lazily on first access, so importing a single
+config submodule doesn't read every feature's config file from disk.
 """
 
-from config.core.base_config import BaseConfig
-from config.features.embed_config import embed
-from config.features.moderation import mod as mod_config
-from config.features.reactions import forward as forward_config, link as link_config
-from config.features.redeye_config import redeye as redeye_config
+import importlib
+
+# Exported name -> (module path, attribute)
+_LAZY_ATTRS = {
+    'BaseConfig': ('config.core.base_config', 'BaseConfig'),
+    'embed': ('config.features.embed_config', 'embed'),
+    'mod_config': ('config.features.moderation', 'mod'),
+    'forward_config': ('config.features.reactions', 'forward'),
+    'reaction_forward_config': ('config.features.reactions', 'forward'),
+    'link_config': ('config.features.reactions', 'link'),
+    'link_reaction_config': ('config.features.reactions', 'link'),
+    'redeye_config': ('config.features.redeye_config', 'redeye')
+}
+
+def __getattr__(name):
+    """Import a configuration instance on first access and cache it on the package."""
+    try:
+        module_path, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_path), attr)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __all__ = [
     'BaseConfig',
@@ -1,16 +1,43 @@
 """
 Base configuration class providing common functionality for all config objects.
 """
+import asyncio
+import atexit
 import json
+from contextlib import contextmanager
 import os
 import shutil
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional
 import logging
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Delay before queued saves are flushed, so rapid edits share one write
+FLUSH_DELAY = 0.5
+
+# Configs with queued changes, and the task that will flush them
+_dirty_configs = set()
+_flush_task = None
+
+async def _flush_dirty_configs() -> None:
+    """Wait for edits to settle, then save every dirty config off the event loop."""
+    global _flush_task
+    try:
+        await asyncio.sleep(FLUSH_DELAY)
+        while _dirty_configs:
+            await _dirty_configs.pop().save_config_async()
+    finally:
+        _flush_task = None
+
+def flush_dirty_configs() -> None:
+    """Synchronously save every config with queued changes, e.g. on shutdown."""
+    while _dirty_configs:
+        _dirty_configs.pop().save_config()
+
+atexit.register(flush_dirty_configs)
+
 class BaseConfig:
     """
     Base configuration class that provides common functionality for all config objects.
@@ -30,14 +57,27 @@ class BaseConfig:
         self.default_config = default_config
         self.version = version
         self._config: Dict[str, Any] = {}
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._revision = 0
+        self._saved_hash = None
+        # ID list key -> (revision, frozenset of the IDs)
+        self._id_sets: Dict[str, tuple] = {}
         self._load_config()
     
+    @property
+    def revision(self) -> int:
+        """Counter bumped whenever configuration values change through this object."""
+        return self._revision
+    
     def _load_config(self) -> None:
         """Load configuration from file or create with defaults."""
+        self._revision += 1
         try:
             if os.path.exists(self.config_path):
                 with open(self.config_path, 'r') as f:
                     self._config = json.load(f)
+                    self._saved_hash = hash(json.dumps(self._config, indent=4))
                     # Check if migration is needed
                     if self._config.get('version') != self.version:
                         self.migrate_config(self._config.get('version', '0.0.0'), self.version)
@@ -55,6 +95,27 @@ class BaseConfig:
         """
         Save the current configuration to file.
         
+        Skips the write when nothing changed since the last save or load.
+        
+        Returns:
+            bool: True if save was successful, False otherwise
+        """
+        try:
+            payload = json.dumps(self._config, indent=4)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Error serializing config for {self.config_path}: {e}")
+            return False
+        if hash(payload) == self._saved_hash:
+            return True
+        return self._write_config(payload)
+    
+    def _write_config(self, payload: str) -> bool:
+        """
+        Back up the current file and write the serialized configuration.
+        
+        Args:
+            payload: The serialized configuration
+            
         Returns:
             bool: True if save was successful, False otherwise
         """
@@ -67,12 +128,51 @@ class BaseConfig:
             
             # Save new config
             with open(self.config_path, 'w') as f:
-                json.dump(self._config, f, indent=4)
+                f.write(payload)
+            self._saved_hash = hash(payload)
             return True
         except Exception as e:
             logger.error(f"Error saving config to {self.config_path}: {e}")
             return False
     
+    async def save_config_async(self) -> bool:
+        """
+        Save the current configuration without blocking the event loop.
+        
+        The configuration is serialized on the loop so the worker thread
+        never reads it while a command is mutating it. Skips the write when
+        nothing changed since the last save or load.
+        
+        Returns:
+            bool: True if save was successful, False otherwise
+        """
+        try:
+            payload = json.dumps(self._config, indent=4)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Error serializing config for {self.config_path}: {e}")
+            return False
+        if hash(payload) == self._saved_hash:
+            return True
+        return await asyncio.to_thread(self._write_config, payload)
+    
+    def schedule_save(self) -> None:
+        """
+        Queue a coalesced save of the current configuration.
+        
+        Saves queued within FLUSH_DELAY of each other share one disk write.
+        Saves immediately when no event loop is running.
+        """
+        global _flush_task
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save_config()
+            return
+        
+        _dirty_configs.add(self)
+        if _flush_task is None:
+            _flush_task = loop.create_task(_flush_dirty_configs())
+    
     def backup_config(self) -> None:
         """Create a backup of the current configuration."""
         if not os.path.exists(self.config_path):
@@ -249,13 +349,87 @@ class BaseConfig:
         """
         return self._config.get(key, default)
     
-    def set(self, key: str, value: Any) -> None:
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a shallow copy of all configuration values.
+        
+        Returns:
+            Dict[str, Any]: Copy of the current configuration
+        """
+        return dict(self._config)
+    
+    def id_set(self, key: str) -> FrozenSet[int]:
+        """
+        Get a list of IDs as a frozenset for constant-time membership checks.
+        
+        The value is still stored as a list; the set is cached until the
+        configuration changes.
+        
+        Args:
+            key: Configuration key holding a list of IDs
+            
+        Returns:
+            FrozenSet[int]: The IDs
+        """
+        cached = self._id_sets.get(key)
+        if cached is None or cached[0] != self._revision:
+            cached = (self._revision, frozenset(self._config.get(key) or ()))
+            self._id_sets[key] = cached
+        return cached[1]
+    
+    def set(self, key: str, value: Any, save: bool = True) -> bool:
         """
         Set a configuration value.
         
         Args:
             key: Configuration key
             value: Value to set
+            save: Whether to save to disk immediately
+            
+        Returns:
+            bool: True if successful, False otherwise
         """
         self._config[key] = value
-        self.save_config() 
\ No newline at end of file
+        self._revision += 1
+        if save and self._batch_depth:
+            self._batch_dirty = True
+        elif save:
+            return self.save_config()
+        return True
+    
+    def update(self, settings_dict: Dict[str, Any], save: bool = True) -> bool:
+        """
+        Update multiple configuration values with a single save.
+        
+        Args:
+            settings_dict: Dictionary of configuration values to update
+            save: Whether to save to disk immediately
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self._config.update(settings_dict)
+        self._revision += 1
+        if save and self._batch_depth:
+            self._batch_dirty = True
+        elif save:
+            return self.save_config()
+        return True
+    
+    @contextmanager
+    def batch_update(self):
+        """
+        Group several writes into a single save.
+        
+        Saves requested by set() or update() inside the block, including
+        property setters, are deferred and issued once via schedule_save()
+        when the outermost block exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self.schedule_save() 
\ No newline at end of file
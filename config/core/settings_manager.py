@@ -7,6 +7,7 @@ It handles loading, saving, and validating configuration.
 
 import os
 import json
+import asyncio
 import logging
 import threading
 from typing import Any, Dict, List, Optional, Union
@@ -40,6 +41,7 @@ class SettingsManager:
         self.module_name = module_name
         self.default_settings = default_settings
         self.settings = {}
+        self._saved_hash = None
         self.settings_file = os.path.join(SETTINGS_DIR, f"{module_name.lower()}.json")
         self.load_settings()
     
@@ -62,6 +64,7 @@ class SettingsManager:
                 logger.info(f"Loading settings from {self.settings_file}")
                 with open(self.settings_file, 'r', encoding='utf-8') as f:
                     loaded_settings = json.load(f)
+                self._saved_hash = hash(json.dumps(loaded_settings, indent=2))
                     
                 # Deep merge with defaults to ensure all required keys exist
                 self.settings = self._deep_merge(self.default_settings, loaded_settings)
@@ -92,6 +95,8 @@ class SettingsManager:
         """
         Save current settings to the JSON file.
         
+        Skips the write when nothing changed since the last save or load.
+        
         Returns:
             True if successful, False otherwise
         """
@@ -102,6 +107,10 @@ class SettingsManager:
             return False
             
         try:
+            payload = json.dumps(self.settings, indent=2)
+            if hash(payload) == self._saved_hash:
+                return True
+            
             # Double-check directory exists
             os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
             
@@ -110,13 +119,14 @@ class SettingsManager:
             # Write to a temporary file first
             temp_file = f"{self.settings_file}.tmp"
             with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2)
+                f.write(payload)
             
             # Then rename it to the actual file name
             if os.path.exists(self.settings_file):
                 os.replace(temp_file, self.settings_file)
             else:
                 os.rename(temp_file, self.settings_file)
+            self._saved_hash = hash(payload)
                 
             logger.info(f"Saved settings for module {self.module_name}")
             return True
@@ -133,6 +143,15 @@ class SettingsManager:
             # Always release the lock, even if an exception occurred
             file_lock.release()
     
+    async def save_settings_async(self) -> bool:
+        """
+        Save current settings without blocking the event loop.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        return await asyncio.to_thread(self.save_settings)
+    
     def get(self, key: str, default: Optional[Any] = None) -> Any:
         """
         Get a setting value.
@@ -187,16 +206,17 @@ class SettingsManager:
     
     def update(self, settings_dict: Dict[str, Any], save: bool = True) -> bool:
         """
-        Update multiple settings at once.
+        Update multiple settings at once with a single save.
         
         Args:
-            settings_dict: Dictionary of settings to update
+            settings_dict: Dictionary of settings to update, keys may use dot notation
             save: Whether to save to disk immediately
             
         Returns:
             True if successful, False otherwise
         """
-        self.settings.update(settings_dict)
+        for key, value in settings_dict.items():
+            self.set(key, value, save=False)
         if save:
             return self.save_settings()
         return True
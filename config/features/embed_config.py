@@ -6,7 +6,7 @@ These settings are applied to all embedded notifications across all modules.
 """
 
 import os
-from typing import Optional
+from typing import Callable, List, Optional
 from discord import Embed
 from datetime import datetime
 
@@ -33,6 +33,9 @@ class EmbedConfig:
         self.DEFAULT_EMBED_TITLE = os.getenv('EMBED_DEFAULT_TITLE', 'Notification')
         self.INCLUDE_TIMESTAMP = os.getenv('EMBED_INCLUDE_TIMESTAMP', 'True').lower() in ('true', '1', 't')
 
+        # Styled template embeds and named template payloads, keyed by the options and styling values they were built with
+        self._templates = {}
+
     def apply_default_styling(self, embed: Embed, include_footer: bool = True, include_thumbnail: bool = True) -> Embed:
         """
         Apply default styling to an embed based on configuration.
@@ -62,5 +65,94 @@ class EmbedConfig:
         
         return embed
 
+    def _style_key(self, include_footer: bool, include_thumbnail: bool) -> tuple:
+        """Get the cache key for templates built with the current styling."""
+        return (
+            include_footer,
+            include_thumbnail,
+            self.EMBED_COLOR,
+            self.FOOTER_TEXT,
+            self.FOOTER_ICON_URL,
+            self.THUMBNAIL_URL
+        )
+
+    def get_template(self, include_footer: bool = True, include_thumbnail: bool = True) -> Embed:
+        """
+        Get a cached embed with the default styling applied.
+        
+        The template is shared, so copy it before modifying.
+        
+        Args:
+            include_footer: Whether to include the footer
+            include_thumbnail: Whether to include the thumbnail
+            
+        Returns:
+            The styled template embed
+        """
+        key = self._style_key(include_footer, include_thumbnail)
+        template = self._templates.get(key)
+        if template is None:
+            template = self.apply_default_styling(Embed(), include_footer, include_thumbnail)
+            template.timestamp = None
+            self._templates[key] = template
+        return template
+
+    def create_embed(self, title: Optional[str] = None, description: Optional[str] = None,
+                     include_footer: bool = True, include_thumbnail: bool = True) -> Embed:
+        """
+        Create a new embed from the cached styled template.
+        
+        Args:
+            title: The embed title
+            description: The embed description
+            include_footer: Whether to include the footer
+            include_thumbnail: Whether to include the thumbnail
+            
+        Returns:
+            The styled embed
+        """
+        embed = self.get_template(include_footer, include_thumbnail).copy()
+        embed.title = title
+        embed.description = description
+        if self.INCLUDE_TIMESTAMP:
+            embed.timestamp = datetime.now()
+        return embed
+
+    def create_from_template(self, name: str, build: Callable[[Embed], None],
+                             include_footer: bool = True, include_thumbnail: bool = True,
+                             fields: Optional[List[dict]] = None) -> Embed:
+        """
+        Create a new embed from a cached template with static content.
+        
+        The template is built once per name by passing a styled embed to
+        build, which sets the content that never changes (title, description,
+        fixed fields), and is cached as its raw payload. Each call returns a
+        fresh embed built from that payload.
+        
+        Args:
+            name: Unique name of the template
+            build: Callable that adds the static content to the embed
+            include_footer: Whether to include the footer
+            include_thumbnail: Whether to include the thumbnail
+            fields: Field payloads ({"name", "value", "inline"}) to put ahead of the static fields
+            
+        Returns:
+            The styled embed
+        """
+        key = (name,) + self._style_key(include_footer, include_thumbnail)
+        payload = self._templates.get(key)
+        if payload is None:
+            template = self.get_template(include_footer, include_thumbnail).copy()
+            build(template)
+            payload = template.to_dict()
+            self._templates[key] = payload
+        # Copy the field dicts so changes to the embed don't leak into the template
+        data = dict(payload)
+        data['fields'] = (fields or []) + [dict(field) for field in payload.get('fields', ())]
+        embed = Embed.from_dict(data)
+        if self.INCLUDE_TIMESTAMP:
+            embed.timestamp = datetime.now()
+        return embed
+
 # Create and export the config instance
 embed = EmbedConfig() 
\ No newline at end of file
@@ -3,7 +3,7 @@ Configuration for reaction-related features.
 Includes both forward and link reaction configurations.
 """
 import os
-from typing import Dict, Any, List, Set, Optional
+from typing import Dict, Any, List, Set, Optional, Tuple
 import logging
 from config.core.base_config import BaseConfig
 
@@ -266,9 +266,73 @@ class LinkConfig(BaseConfig):
             'data',
             'link_reaction_config.json'
         )
+        self._stores_by_name: Dict[str, Dict[str, Any]] = {}
+        self._stores_by_channel: Dict[int, List[Tuple[str, Dict[str, Any]]]] = {}
+        self._store_index_dirty = True
         super().__init__(config_path, LINK_DEFAULT_CONFIG, version="1.0.0")
         self._settings_manager = self  # Store the instance reference
     
+    def set(self, key: str, value: Any, save: bool = True) -> bool:
+        """
+        Set a configuration value, invalidating the store index when needed.
+        
+        Args:
+            key: Configuration key
+            value: Value to set
+            save: Whether to save to disk immediately
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if key == "STORES":
+            value = self._normalize_stores(value)
+            self._store_index_dirty = True
+        return super().set(key, value, save=save)
+    
+    def update(self, settings_dict: Dict[str, Any], save: bool = True) -> bool:
+        """
+        Update multiple configuration values, invalidating the store index when needed.
+        
+        Args:
+            settings_dict: Dictionary of configuration values to update
+            save: Whether to save to disk immediately
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if "STORES" in settings_dict:
+            settings_dict = {**settings_dict, "STORES": self._normalize_stores(settings_dict["STORES"])}
+            self._store_index_dirty = True
+        return super().update(settings_dict, save=save)
+    
+    def _load_config(self) -> None:
+        """Load configuration, normalize STORES and invalidate the store index."""
+        self._store_index_dirty = True
+        super()._load_config()
+        stores = self._config.get("STORES")
+        if isinstance(stores, list):
+            self._config["STORES"] = self._normalize_stores(stores)
+            self.save_config()
+    
+    @staticmethod
+    def _normalize_stores(stores: Any) -> Dict[str, Dict[str, Any]]:
+        """
+        Convert the legacy list format of STORES to a dictionary.
+        
+        Args:
+            stores: STORES in either dictionary or legacy list format
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Stores keyed by lower-cased store name
+        """
+        if isinstance(stores, list):
+            return {
+                store['name'].lower(): store
+                for store in stores
+                if isinstance(store, dict) and store.get('name')
+            }
+        return stores
+    
     @property
     def settings_manager(self) -> 'LinkConfig':
         """Get the settings manager instance."""
@@ -329,6 +393,72 @@ class LinkConfig(BaseConfig):
         """Set the store-specific settings."""
         self.set("STORES", value)
     
+    def _rebuild_store_index(self) -> None:
+        """Rebuild the store lookup indexes if STORES changed since the last build."""
+        if not self._store_index_dirty:
+            return
+        by_name = {}
+        by_channel = {}
+        for store_id, store in self.STORES.items():
+            if not isinstance(store, dict):
+                continue
+            by_name[store_id.lower()] = store
+            if store.get('name'):
+                by_name.setdefault(store['name'].lower(), store)
+            for channel_id in store.get('channel_ids', []):
+                by_channel.setdefault(channel_id, []).append((store_id, store))
+        self._stores_by_name = by_name
+        self._stores_by_channel = by_channel
+        self._store_index_dirty = False
+    
+    @property
+    def STORES_BY_NAME(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Index of store settings keyed by lower-cased store ID and name.
+        
+        Rebuilt lazily after STORES changes.
+        """
+        self._rebuild_store_index()
+        return self._stores_by_name
+    
+    @property
+    def STORES_BY_CHANNEL(self) -> Dict[int, List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Index of (store ID, store settings) pairs keyed by monitored channel ID.
+        
+        Rebuilt lazily after STORES changes.
+        """
+        self._rebuild_store_index()
+        return self._stores_by_channel
+    
+    def get_store(self, store_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a store's settings by ID or name, case-insensitively.
+        
+        Args:
+            store_id: Store ID or name
+            
+        Returns:
+            Optional[Dict[str, Any]]: The store settings, or None if not configured
+        """
+        return self.STORES_BY_NAME.get(store_id.lower())
+    
+    def set_store(self, store_id: str, store_config: Dict[str, Any], save: bool = True) -> bool:
+        """
+        Add or replace a single store's settings.
+        
+        Args:
+            store_id: Store ID
+            store_config: The store settings
+            save: Whether to save to disk immediately
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        stores = self.STORES
+        stores[store_id] = store_config
+        return self.set("STORES", stores, save=save)
+    
     def validate_config(self) -> bool:
         """
         Validate the link reaction configuration.
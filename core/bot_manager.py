@@ -21,7 +21,9 @@ Classes:
 """
 
 import logging
+import random
 import discord
+from discord import app_commands
 from discord.ext import commands
 import asyncio
 
@@ -34,6 +36,23 @@ from core.command_router import CommandRouter
 
 logger = logging.getLogger('discord_bot.bot_manager')
 
+async def _ping(interaction: discord.Interaction):
+    await interaction.response.send_message("Pong! 🏓")
+
+async def _hi(interaction: discord.Interaction):
+    await interaction.response.send_message(f"Hello there, {interaction.user.display_name}!")
+
+async def _number(interaction: discord.Interaction, min_value: int = 1, max_value: int = 100):
+    number = random.randint(min_value, max_value)
+    await interaction.response.send_message(f"🎲 Your random number is: {number}")
+
+# Basic commands per module, built once at import so bots only attach them
+MODULE_COMMANDS = {
+    'mod': [app_commands.Command(name="ping", description="Check if the bot is responsive and view latency", callback=_ping)],
+    'online': [app_commands.Command(name="hi", description="Get a friendly greeting from the bot", callback=_hi)],
+    'instore': [app_commands.Command(name="number", description="Generate a random number", callback=_number)],
+}
+
 class BotManager:
     """
     Manages the lifecycle and configuration of Discord bot instances.
@@ -188,24 +207,9 @@ class BotManager:
                         intents=intents
                     )
                     
-                    # Register commands for this module
-                    if module_name == 'mod':
-                        # Register ping command
-                        @bot.tree.command(name="ping", description="Check if the bot is responsive and view latency")
-                        async def ping(interaction: discord.Interaction):
-                            await interaction.response.send_message("Pong! 🏓")
-                    elif module_name == 'online':
-                        # Register hi command
-                        @bot.tree.command(name="hi", description="Get a friendly greeting from the bot")
-                        async def hi(interaction: discord.Interaction):
-                            await interaction.response.send_message(f"Hello there, {interaction.user.display_name}!")
-                    elif module_name == 'instore':
-                        # Register number command
-                        @bot.tree.command(name="number", description="Generate a random number")
-                        async def number(interaction: discord.Interaction, min_value: int = 1, max_value: int = 100):
-                            import random
-                            number = random.randint(min_value, max_value)
-                            await interaction.response.send_message(f"🎲 Your random number is: {number}")
+                    # Attach this module's prebuilt commands in one pass
+                    for command in MODULE_COMMANDS.get(module_name, ()):
+                        bot.tree.add_command(command)
                     
                     # Cogs will be loaded in discord_bot.py
                     
@@ -246,7 +250,7 @@ class BotManager:
         # In development mode, sync commands first
         if is_development():
             for bot_name, bot in self.bots.items():
-                self.command_sync.sync_commands(bot, bot_name)
+                self.command_sync.sync_on_ready(bot, bot_name)
         
         # Start each bot
         for bot_name, bot in self.bots.items():
@@ -325,14 +329,11 @@ class BotManager:
         # Log modules loaded
         logger.info(f"Setting up bot: {bot_name} with modules: {modules}")
         
-        # Load and register all modules for this bot
+        # Load and register all modules for this bot; each module registers its own commands
         self.module_loader.load_modules(bot, modules)
         
-        # Register standard commands and features
-        self.command_sync.register_module_commands(bot)
-        
         # Set up command sync
-        self.command_sync.sync_commands(bot, bot_name)
+        self.command_sync.sync_on_ready(bot, bot_name)
         
         # Start the bot
         logger.info(f"Starting bot: {bot_name}")
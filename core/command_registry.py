@@ -22,16 +22,18 @@ Critical:
 - Must batch updates
 """
 
+import time
 import logging
+import random
+import weakref
 import discord
 from discord import app_commands
 from typing import Dict, Set, Optional, List, Any
-from datetime import datetime, timedelta
 from .commands.base import BaseCommand
 from .commands.permission_commands import permission_commands
 from .command_sync import command_sync
 from .error_handler import CommandError
-import asyncio
+from modules.features.mod.pinger.config_cmd import config_command as pinger_config_command
 
 logger = logging.getLogger('discord_bot.command_registry')
 
@@ -53,7 +55,7 @@ class CommandRegistry:
         _registered_commands (Set[str]): Set of synced command names
         command_groups (Dict[str, List[BaseCommand]]): Dictionary of command group names to commands
         _command_cache (Dict[str, Any]): Cache for command metadata
-        _last_sync (datetime): Timestamp of last sync operation
+        _last_sync (float): Monotonic time of last sync operation
         _pending_syncs (Set[str]): Set of commands pending sync
         
     Critical:
@@ -76,7 +78,7 @@ class CommandRegistry:
         self._registered_commands: Set[str] = set()
         self.command_groups: Dict[str, List[BaseCommand]] = {}
         self._command_cache: Dict[str, Any] = {}
-        self._last_sync = datetime.min
+        self._last_sync = 0.0
         self._pending_syncs: Set[str] = set()
         
     def register_command(self, command: BaseCommand, group: str = None) -> None:
@@ -103,7 +105,7 @@ class CommandRegistry:
             'description': command.description,
             'permissions': command.permissions,
             'group': group,
-            'registered_at': datetime.now()
+            'registered_at': time.monotonic()
         }
         
         if group:
@@ -111,7 +113,7 @@ class CommandRegistry:
                 self.command_groups[group] = []
             self.command_groups[group].append(command)
             
-        logger.info(f"Registered command: {command.name} in group: {group}")
+        logger.info("Registered command: %s in group: %s", command.name, group)
         
     def register_commands(self, commands: List[BaseCommand], group: str = None) -> None:
         """
@@ -166,7 +168,6 @@ class CommandRegistry:
         2. Registers with Discord's command system
         3. Updates sync state tracking
         4. Handles rate limits
-        5. Batches updates
         
         Args:
             bot (discord.Client): The Discord bot instance
@@ -175,29 +176,19 @@ class CommandRegistry:
             Uses command_sync for optimized registration
         """
         try:
-            # Register commands in batches
-            batch_size = 25
-            commands = list(self._commands.values())
-            
-            for i in range(0, len(commands), batch_size):
-                batch = commands[i:i + batch_size]
-                for command in batch:
-                    if command.name in self._pending_syncs:
-                        app_command = command.to_app_command()
-                        success = await command_sync.register_command(
-                            bot=bot,
-                            command_name=command.name,
-                            command_callback=app_command.callback,
-                            description=command.description,
-                            **command.options
-                        )
-                        if success:
-                            self._pending_syncs.remove(command.name)
-                            
-                # Small delay between batches to avoid rate limits
-                if i + batch_size < len(commands):
-                    await asyncio.sleep(1)
-                    
+            for command in self._commands.values():
+                if command.name in self._pending_syncs:
+                    app_command = command.to_app_command()
+                    success = command_sync.register_command(
+                        bot=bot,
+                        command_name=command.name,
+                        command_callback=app_command.callback,
+                        description=command.description,
+                        **command.options
+                    )
+                    if success:
+                        self._pending_syncs.remove(command.name)
+                        
             # Sync commands if needed
             if self._pending_syncs:
                 await command_sync.sync_commands(bot)
@@ -206,7 +197,7 @@ class CommandRegistry:
             logger.info("Successfully registered all commands with Discord")
             
         except Exception as e:
-            logger.error(f"Failed to register commands: {e}", exc_info=True)
+            logger.exception("Failed to register commands: %s", e)
             raise CommandError(f"Failed to register commands: {str(e)}")
             
     @property
@@ -253,37 +244,29 @@ class CommandRegistry:
             tree: The Discord command tree
             
         Note:
-            Uses batching and rate limiting for optimal performance
+            Only touches the local tree, so no API rate limits apply
         """
         try:
-            # Register ungrouped commands first
-            ungrouped = self.command_groups.get(None, [])
-            for i in range(0, len(ungrouped), 25):
-                batch = ungrouped[i:i + 25]
-                for command in batch:
-                    command.register(tree)
-                if i + 25 < len(ungrouped):
-                    await asyncio.sleep(1)
-                    
-            # Then register grouped commands
+            # Register ungrouped commands first, then grouped ones
+            for command in self.command_groups.get(None, []):
+                command.register(tree)
             for group_name, commands in self.command_groups.items():
                 if group_name:
-                    for i in range(0, len(commands), 25):
-                        batch = commands[i:i + 25]
-                        for command in batch:
-                            command.register(tree)
-                        if i + 25 < len(commands):
-                            await asyncio.sleep(1)
-                            
+                    for command in commands:
+                        command.register(tree)
+                        
             logger.info("All commands have been set up")
             
         except Exception as e:
-            logger.error(f"Failed to set up commands: {e}", exc_info=True)
+            logger.exception("Failed to set up commands: %s", e)
             raise CommandError(f"Failed to set up commands: {str(e)}")
 
 # Global command registry instance
 command_registry = CommandRegistry()
 
+# Bots whose command trees have already been populated by register_all_commands
+_registered_bots = weakref.WeakSet()
+
 def register_all_commands(bot: discord.Client) -> None:
     """
     Register all commands with the Discord bot.
@@ -297,8 +280,13 @@ def register_all_commands(bot: discord.Client) -> None:
         bot (discord.Client): The Discord bot instance
         
     Note:
-        Commands must be registered before syncing with Discord
+        Commands must be registered before syncing with Discord.
+        Calling this again for the same bot (e.g. after a reconnect) is a no-op.
     """
+    if bot in _registered_bots:
+        logger.debug("Commands already registered for this bot, skipping")
+        return 0
+    
     logger.info("Registering all commands centrally")
     registered_count = 0
     registered_commands = []
@@ -314,20 +302,14 @@ def register_all_commands(bot: discord.Client) -> None:
             Check bot responsiveness and latency.
             
             This command:
-            1. Measures response time
-            2. Calculates latency
-            3. Returns results to user
+            1. Reads the gateway latency
+            2. Returns results to user in a single response
             
             Args:
                 interaction (discord.Interaction): Command interaction
             """
-            import time
-            start_time = time.time()
-            await interaction.response.defer(ephemeral=False)
-            end_time = time.time()
-            
-            latency = round((end_time - start_time) * 1000)
-            await interaction.followup.send(f"Pong! 🏓 Latency: {latency}ms")
+            latency = round(bot.latency * 1000)
+            await interaction.response.send_message(f"Pong! 🏓 Latency: {latency}ms")
             logger.debug(f"Ping command executed by {interaction.user} with latency {latency}ms")
         
         registered_commands.append("ping")
@@ -349,7 +331,6 @@ def register_all_commands(bot: discord.Client) -> None:
             Args:
                 interaction (discord.Interaction): Command interaction
             """
-            import random
             greetings = [
                 "Hello there, {}! How are you doing today?",
                 "Hi, {}! Nice to see you!",
@@ -386,7 +367,6 @@ def register_all_commands(bot: discord.Client) -> None:
                 min_value (int, optional): Minimum value (default: 1)
                 max_value (int, optional): Maximum value (default: 100)
             """
-            import random
             if min_value >= max_value:
                 await interaction.response.send_message(
                     "Error: Minimum value must be less than maximum value.",
@@ -443,8 +423,7 @@ def register_all_commands(bot: discord.Client) -> None:
                 return
             
             try:
-                from modules.mod.pinger.config_cmd import config_command
-                await config_command(interaction, setting, value)
+                await pinger_config_command(interaction, setting, value)
             except Exception as e:
                 logger.error(f"Error executing pinger-config command: {str(e)}")
                 await interaction.response.send_message(
@@ -457,7 +436,7 @@ def register_all_commands(bot: discord.Client) -> None:
         registered_commands.append("pinger-config")
         registered_count += 1
     except Exception as e:
-        logger.error(f"Error registering utility commands: {e}")
+        logger.exception("Error registering utility commands: %s", e)
     
     try:
         # Register purge command
@@ -519,10 +498,11 @@ def register_all_commands(bot: discord.Client) -> None:
         registered_commands.append("purge")
         registered_count += 1
     except Exception as e:
-        logger.error(f"Error registering purge command: {e}")
+        logger.exception("Error registering purge command: %s", e)
     
     logger.info(f"Registered {registered_count} commands centrally")
     for cmd in registered_commands:
         logger.info(f"  - Registered command: {cmd}")
     
+    _registered_bots.add(bot)
     return registered_count
\ No newline at end of file
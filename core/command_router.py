@@ -290,7 +290,7 @@ class CommandRouter:
             await self.bot.tree.sync()
             logger.info("Successfully synced commands with Discord")
         except Exception as e:
-            logger.error(f"Failed to sync commands: {e}", exc_info=e)
+            logger.exception("Failed to sync commands: %s", e)
             raise CommandError("Failed to sync commands with Discord")
             
     def get_command(self, name: str) -> Optional[BaseCommand]:
@@ -27,12 +27,22 @@ Classes:
     CommandSync: Main class for managing Discord slash commands
 """
 
+from __future__ import annotations
+
+import json
+import time
+import heapq
+import hashlib
+import random
+import inspect
 import logging
 import discord
 import asyncio
-from typing import Dict, List, Optional, Set, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from discord import app_commands
-from datetime import datetime, timedelta
+from discord.ext import commands
 from config.core.settings import settings
 from config.environment.environment import is_development
 from core.error_handler import CommandError
@@ -41,10 +51,119 @@ logger = logging.getLogger('discord_bot.command_sync')
 
 # Constants for rate limit handling
 SYNC_COOLDOWN = 60  # Minimum seconds between syncs
-RETRY_BUFFER = 10.0  # Buffer to add to rate limit times
+RETRY_BASE_DELAY = 1.0  # First backoff delay in seconds, doubled per attempt
+RETRY_MAX_DELAY = 30.0  # Upper bound for a single backoff delay
+RETRY_JITTER = 0.5  # Maximum fraction of random delay added to each backoff
 MAX_RETRIES = 3
-BATCH_SIZE = 25
+BATCH_SIZE = 100  # Discord's limit for one bulk overwrite
 CACHE_TTL = 3600  # Cache time-to-live in seconds
+SYNC_RATE_LIMIT = 5  # Syncs allowed per period for one application
+SYNC_RATE_PERIOD = 20.0  # Seconds for the sync bucket to fully refill
+
+# Development guilds, deduplicated once at import so reconnects don't redo it
+_GUILD_IDS: Tuple[int, ...] = tuple(dict.fromkeys(settings.GUILD_IDS))
+
+def _backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Compute how long to wait before the next sync attempt.
+    
+    A server-provided retry_after is used as-is as the floor; otherwise the
+    delay grows exponentially. Random jitter keeps concurrent bots from
+    retrying in lockstep.
+    
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        retry_after: Seconds Discord asked us to wait, if any
+        
+    Returns:
+        float: Delay in seconds
+    """
+    delay = min(RETRY_MAX_DELAY, max(retry_after or RETRY_BASE_DELAY, RETRY_BASE_DELAY * (2 ** attempt)))
+    return delay * (1 + random.uniform(0, RETRY_JITTER))
+
+@lru_cache(maxsize=128)
+def _guild_obj(guild_id: int) -> discord.Object:
+    """Return a shared snowflake wrapper for a guild ID."""
+    return discord.Object(id=guild_id)
+
+def _sync_target(bot: discord.Client, guild_id: Optional[int] = None) -> Tuple[int, Optional[int]]:
+    """
+    Key sync state by application and guild.
+    
+    Each bot token is its own application with its own commands and rate
+    limits. A bot that hasn't logged in yet has no application ID, so it
+    falls back to its own identity.
+    """
+    return (bot.application_id or id(bot), guild_id)
+
+def _tree_hash(bot: discord.Client, commands: List[app_commands.Command]) -> str:
+    """
+    Hash the payload of every command a sync would send.
+    
+    Args:
+        bot: Discord bot instance
+        commands: Commands in the target's tree
+        
+    Returns:
+        str: Hex digest of the command payloads
+    """
+    payloads = []
+    for cmd in commands:
+        try:
+            payloads.append(cmd.to_dict(bot.tree))
+        except TypeError:  # discord.py < 2.4 takes no tree argument
+            payloads.append(cmd.to_dict())
+    payloads.sort(key=lambda payload: (payload.get('type', 1), payload['name']))
+    encoded = json.dumps(payloads, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+class SyncRateLimiter:
+    """
+    Token bucket for one application's command syncs.
+    
+    Bots that share a token share the application's sync rate limit, so
+    the bucket is kept per application rather than per CommandSync.
+    
+    Attributes:
+        capacity (int): Maximum number of tokens
+        refill_rate (float): Tokens added per second
+    """
+    
+    def __init__(self, capacity: int = SYNC_RATE_LIMIT, period: float = SYNC_RATE_PERIOD):
+        """Initialize a full bucket."""
+        self.capacity = capacity
+        self.refill_rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+        
+    def block_for(self, seconds: float) -> None:
+        """
+        Drain the bucket so no sync is attempted for the given time.
+        
+        Args:
+            seconds: Time to wait, e.g. a rate limit's retry_after
+        """
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.refill_rate)
+        
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.refill_rate)
+                self._refill()
+            self._tokens -= 1
+
+# Sync rate limiters per application ID, shared by every CommandSync instance
+sync_rate_limiters = defaultdict(SyncRateLimiter)
 
 class CommandSync:
     """
@@ -61,136 +180,199 @@ class CommandSync:
     8. Batched command updates
     
     Attributes:
-        _command_cache (Dict[str, Tuple[app_commands.Command, datetime]]): Cache of registered commands with timestamps
-        _last_sync (Dict[int, datetime]): Last sync time per guild
+        _cache_cmd (Dict[str, app_commands.Command]): Cache of registered commands
+        _cache_expiry (Dict[str, float]): Monotonic expiry time per cached command
+        _expiry_heap (List[Tuple[float, str]]): Cache expiry times, earliest first
+        _valid_names (Set[str]): Names of cached commands that have not expired
+        _gates (Dict[Tuple[int, Optional[int]], float]): Monotonic time until which syncs are blocked, per target
+        _in_flight (Set[Tuple[int, Optional[int]]]): Targets with a sync running
         _sync_queue (Set[str]): Queue of commands pending sync
-        _guild_sync_states (Dict[int, bool]): Sync state per guild
-        _global_sync_state (bool): Global sync state
-        _sync_lock (asyncio.Lock): Lock for synchronization operations
-        _rate_limit_data (Dict[str, Dict]): Rate limit tracking per endpoint
+        _tree_hashes (Dict[Tuple[int, Optional[int]], str]): Hash of the command tree last synced to each target
+        _sync_locks (Dict[Tuple[int, Optional[int]], asyncio.Lock]): Sync lock per target
+        _built_cmds (Dict[Tuple[str, int], app_commands.Command]): Built commands by name and callback id
+        _sync_done (Set[str]): Bots whose commands have been synced since they connected
+        _ready_hooked (Dict[str, commands.Bot]): Bots with a sync on_ready listener attached, by name
     """
     
     def __init__(self):
         """Initialize the command synchronization system."""
-        self._command_cache = {}  # Now stores (command, timestamp) tuples
-        self._last_sync = {}
+        self._cache_cmd = {}
+        self._cache_expiry = {}
+        self._expiry_heap = []
+        self._valid_names = set()
+        self._gates = {}
+        self._in_flight = set()
         self._sync_queue = set()
-        self._guild_sync_states = {}
-        self._global_sync_state = False
-        self._sync_lock = asyncio.Lock()
-        self._rate_limit_data = {}
+        self._tree_hashes = {}
+        self._sync_locks = defaultdict(asyncio.Lock)
+        self._built_cmds = {}
+        self._sync_done = set()
+        self._ready_hooked = {}
         
-    def _can_sync(self, guild_id: Optional[int] = None) -> bool:
+    def _can_sync(self, target: Tuple[int, Optional[int]]) -> bool:
         """
         Check if sync is allowed based on cooldown and rate limits.
         
         Args:
-            guild_id: Optional guild ID to check
+            target: Application and optional guild ID to check
             
         Returns:
             bool: True if sync is allowed
         """
-        now = datetime.now()
+        return self._gates.get(target, 0.0) <= time.monotonic()
         
-        # Check cooldown
-        last_sync = self._last_sync.get(guild_id, datetime.min)
-        if (now - last_sync).total_seconds() < SYNC_COOLDOWN:
-            return False
-            
-        # Check rate limits
-        endpoint = f"sync_{guild_id if guild_id else 'global'}"
-        rate_limit = self._rate_limit_data.get(endpoint, {})
-        if rate_limit:
-            reset_time = rate_limit.get('reset_at', datetime.min)
-            if now < reset_time:
-                return False
-                
-        return True
+    def _block_until(self, target: Tuple[int, Optional[int]], delay: float) -> None:
+        """Block syncs for a target for at least the given number of seconds."""
+        until = time.monotonic() + delay
+        if until > self._gates.get(target, 0.0):
+            self._gates[target] = until
+        
+    def _update_rate_limit(self, target: Tuple[int, Optional[int]], reset_after: float) -> None:
+        """Block syncs for a target until its rate limit resets."""
+        self._block_until(target, reset_after)
         
-    def _update_rate_limit(self, endpoint: str, reset_after: float) -> None:
-        """Update rate limit data for an endpoint."""
-        self._rate_limit_data[endpoint] = {
-            'reset_at': datetime.now() + timedelta(seconds=reset_after),
-            'remaining': 0
-        }
+    def _update_sync_time(self, target: Tuple[int, Optional[int]]) -> None:
+        """Start the cooldown after a completed sync."""
+        self._block_until(target, SYNC_COOLDOWN)
         
     def _is_cache_valid(self, command_name: str) -> bool:
         """Check if a cached command is still valid."""
-        if command_name not in self._command_cache:
-            return False
-            
-        _, timestamp = self._command_cache[command_name]
-        return (datetime.now() - timestamp).total_seconds() < CACHE_TTL
+        return self._cache_expiry.get(command_name, 0.0) > time.monotonic()
+        
+    def _evict_expired(self) -> None:
+        """Drop expired commands from the valid set, popping only heap entries that are due."""
+        now = time.monotonic()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, name = heapq.heappop(self._expiry_heap)
+            # A re-registered command has a newer heap entry, so check the cached expiry
+            if not self._is_cache_valid(name):
+                self._valid_names.discard(name)
         
     async def _batch_sync(self, bot: discord.Client, commands: List[app_commands.Command],
-                         guild_id: Optional[int] = None) -> None:
+                         guild_id: Optional[int] = None) -> List[app_commands.AppCommand]:
         """
-        Sync commands in batches to avoid rate limits.
+        Sync the command tree in a single bulk overwrite, retrying on failure.
+        
+        tree.sync() always sends the whole tree, so one call per target is
+        enough; Discord applies it atomically.
         
         Args:
             bot: Discord bot instance
-            commands: List of commands to sync
+            commands: Commands in the target's tree
             guild_id: Optional guild ID for guild-specific sync
+            
+        Returns:
+            List[app_commands.AppCommand]: Commands Discord reports as synced
+            
+        Raises:
+            CommandError: If there are too many commands or every attempt fails
+        """
+        if len(commands) > BATCH_SIZE:
+            raise CommandError(f"Cannot sync {len(commands)} commands; Discord allows at most {BATCH_SIZE}")
+            
+        # One line for the whole batch, built only when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Attempting to sync %d commands: %s", len(commands),
+                         ", ".join(cmd.name for cmd in commands))
+            
+        return await self._sync_with_backoff(bot, guild_id)
+        
+    async def _sync_with_backoff(self, bot: discord.Client, guild_id: Optional[int] = None,
+                                 max_retries: int = MAX_RETRIES) -> List[app_commands.AppCommand]:
         """
-        endpoint = f"sync_{guild_id if guild_id else 'global'}"
+        Sync the command tree, retrying failures with jittered exponential backoff.
         
-        for i in range(0, len(commands), BATCH_SIZE):
-            batch = commands[i:i + BATCH_SIZE]
-            guild = discord.Object(id=guild_id) if guild_id else None
+        Args:
+            bot: Discord bot instance
+            guild_id: Optional guild ID for guild-specific sync
+            max_retries: Number of attempts before giving up
             
-            for attempt in range(MAX_RETRIES):
-                try:
-                    await bot.tree.sync(guild=guild)
-                    break
-                except discord.HTTPException as e:
-                    if isinstance(e, discord.RateLimited):
-                        self._update_rate_limit(endpoint, e.retry_after)
-                        wait_time = e.retry_after + RETRY_BUFFER
-                    else:
-                        wait_time = (attempt + 1) * RETRY_BUFFER
-                        
-                    if attempt == MAX_RETRIES - 1:
-                        raise CommandError(f"Failed to sync command batch after {MAX_RETRIES} attempts")
-                        
-                    logger.warning(f"Sync attempt {attempt + 1} failed, waiting {wait_time}s: {e}")
-                    await asyncio.sleep(wait_time)
-                    
-            await asyncio.sleep(1)  # Small delay between batches
+        Returns:
+            List[app_commands.AppCommand]: Commands Discord reports as synced
+            
+        Raises:
+            CommandError: If every attempt fails
+        """
+        guild = _guild_obj(guild_id) if guild_id else None
+        target = _sync_target(bot, guild_id)
+        rate_limiter = sync_rate_limiters[target[0]]
+        
+        for attempt in range(max_retries):
+            try:
+                # Hold the lock only for the request; backoff sleeps happen outside it
+                async with self._sync_locks[target]:
+                    await rate_limiter.acquire()
+                    return await bot.tree.sync(guild=guild)
+            except discord.RateLimited as e:
+                self._update_rate_limit(target, e.retry_after)
+                rate_limiter.block_for(e.retry_after)
+                error, retry_after = e, e.retry_after
+            except discord.HTTPException as e:
+                # Client errors other than 429 won't succeed on retry
+                if 400 <= e.status < 500 and e.status != 429:
+                    raise CommandError(f"Fatal sync error {e.status}: {e}") from e
+                error, retry_after = e, None
+                
+            if attempt == max_retries - 1:
+                raise CommandError(f"Failed to sync commands after {max_retries} attempts") from error
+                
+            wait_time = _backoff_delay(attempt, retry_after)
+            logger.warning("Sync attempt %d failed, waiting %.1fs: %s", attempt + 1, wait_time, error)
+            await asyncio.sleep(wait_time)
             
-    async def sync_commands(self, bot: discord.Client, guild_id: Optional[int] = None) -> None:
+    async def sync_commands(self, bot: discord.Client, guild_id: Optional[int] = None) -> bool:
         """
         Synchronize commands with Discord.
         
         Args:
             bot: Discord bot instance
             guild_id: Optional guild ID for guild-specific sync
+            
+        Returns:
+            bool: False if the sync was skipped because one is already running,
+                or by a cooldown or rate limit
+            
+        Raises:
+            CommandError: If the sync fails
         """
-        async with self._sync_lock:
-            if not self._can_sync(guild_id):
-                logger.info(f"Sync cooldown or rate limit active for guild {guild_id}")
-                return
+        target = _sync_target(bot, guild_id)
+        async with self._sync_locks[target]:
+            if target in self._in_flight or not self._can_sync(target):
+                logger.info("Sync in progress, cooldown or rate limit active for guild %s", guild_id)
+                return False
                 
-            try:
-                # Filter out invalid cache entries
-                valid_commands = [
-                    cmd for name, (cmd, _) in self._command_cache.items()
-                    if self._is_cache_valid(name)
-                ]
+            guild = _guild_obj(guild_id) if guild_id else None
+            if guild:
+                # Populate the guild tree from the global commands in one pass
+                bot.tree.copy_global_to(guild=guild)
+            tree_commands = bot.tree.get_commands(guild=guild)
+            
+            # Skip only when this target already has exactly this tree
+            tree_hash = _tree_hash(bot, tree_commands)
+            if self._tree_hashes.get(target) == tree_hash:
+                logger.debug("Commands unchanged %s, skipping sync", f"for guild {guild_id}" if guild_id else "globally")
+                return True
                 
-                await self._batch_sync(bot, valid_commands, guild_id)
-                self._update_sync_time(guild_id)
+            # Reserve the target before releasing the lock so concurrent calls can't both sync
+            self._in_flight.add(target)
+            
+        try:
+            # Locks are taken per attempt so rate-limit backoff doesn't block other syncs
+            synced = await self._batch_sync(bot, tree_commands, guild_id)
+            
+            # No await until the reservation is released, so the cooldown starts before anyone can pass the check
+            self._update_sync_time(target)
+            self._tree_hashes[target] = tree_hash
+        except (discord.HTTPException, CommandError) as e:
+            logger.exception("Failed to sync commands: %s", e)
+            raise CommandError(f"Failed to sync commands: {str(e)}") from e
+        finally:
+            # A failed sync releases the target without starting the cooldown
+            self._in_flight.discard(target)
                 
-                if guild_id:
-                    self._guild_sync_states[guild_id] = True
-                else:
-                    self._global_sync_state = True
-                    
-                logger.info(f"Successfully synced {len(valid_commands)} commands" + 
-                          f" for guild {guild_id}" if guild_id else " globally")
-                          
-            except Exception as e:
-                logger.error(f"Failed to sync commands: {e}", exc_info=True)
-                raise CommandError(f"Failed to sync commands: {str(e)}")
+        logger.info("Successfully synced %d commands %s", len(synced),
+                    f"for guild {guild_id}" if guild_id else "globally")
+        return True
                 
     def register_command(self, bot: discord.Client, command_name: str,
                         command_callback: callable, description: str = "No description provided",
@@ -209,24 +391,39 @@ class CommandSync:
             bool: True if registration successful
         """
         try:
-            # Check cache first
-            if command_name in self._command_cache and self._is_cache_valid(command_name):
-                logger.debug(f"Using cached command {command_name}")
+            # Check cache first; eviction only inspects the heap head, so this stays O(1) when nothing expired
+            self._evict_expired()
+            if command_name in self._valid_names:
+                logger.debug("Using cached command %s", command_name)
                 return True
                 
-            @bot.tree.command(name=command_name, description=description, **kwargs)
-            async def command(interaction: discord.Interaction, **params):
-                return await command_callback(interaction, **params)
+            # Re-attach a command built earlier instead of re-parsing the callback signature
+            key = (command_name, id(command_callback))
+            command = self._built_cmds.get(key)
+            if command is not None:
+                bot.tree.add_command(command, override=True)
+            elif inspect.iscoroutinefunction(command_callback):
+                # Register the callback directly to avoid an extra frame per invocation
+                command = bot.tree.command(name=command_name, description=description, **kwargs)(command_callback)
+            else:
+                @bot.tree.command(name=command_name, description=description, **kwargs)
+                async def command(interaction: discord.Interaction, **params):
+                    return await command_callback(interaction, **params)
+            self._built_cmds[key] = command
                 
-            # Cache the command with timestamp
-            self._command_cache[command_name] = (command, datetime.now())
+            # Cache the command with its expiry
+            expiry = time.monotonic() + CACHE_TTL
+            self._cache_cmd[command_name] = command
+            self._cache_expiry[command_name] = expiry
+            heapq.heappush(self._expiry_heap, (expiry, command_name))
+            self._valid_names.add(command_name)
             self._sync_queue.add(command_name)
             
-            logger.debug(f"Registered command: {command_name}")
+            logger.debug("Registered command: %s", command_name)
             return True
             
-        except Exception as e:
-            logger.error(f"Error registering command {command_name}: {str(e)}")
+        except (app_commands.AppCommandError, TypeError, ValueError) as e:
+            logger.error("Error registering command %s: %s", command_name, e)
             return False
             
     def get_command(self, command_name: str) -> Optional[app_commands.Command]:
@@ -239,55 +436,136 @@ class CommandSync:
         Returns:
             Optional[app_commands.Command]: Cached command or None
         """
-        if command_name in self._command_cache and self._is_cache_valid(command_name):
-            command, _ = self._command_cache[command_name]
-            return command
-        return None
+        return self._cache_cmd.get(command_name) if self._is_cache_valid(command_name) else None
         
     def clear_cache(self) -> None:
         """Clear the command cache."""
-        self._command_cache.clear()
+        self._cache_cmd.clear()
+        self._cache_expiry.clear()
+        self._expiry_heap.clear()
+        self._valid_names.clear()
         self._sync_queue.clear()
         logger.info("Command cache cleared")
         
-    def is_synced(self, guild_id: Optional[int] = None) -> bool:
+    def is_synced(self, bot: discord.Client, guild_id: Optional[int] = None) -> bool:
         """
-        Check if commands are synced.
+        Check if a bot's commands are synced.
         
         Args:
+            bot: Discord bot instance
             guild_id: Optional guild ID to check
             
         Returns:
             bool: True if commands are synced
         """
-        return self._guild_sync_states.get(guild_id, False) if guild_id else self._global_sync_state
+        return _sync_target(bot, guild_id) in self._tree_hashes
+        
+    def sync_on_ready(self, bot: commands.Bot, bot_name: str) -> None:
+        """
+        Sync a bot's commands once it is ready.
+        
+        on_ready fires again after every gateway reconnect; the sync only runs
+        until it first succeeds, or again after resync().
+        
+        Args:
+            bot: Discord bot instance
+            bot_name: Name of the bot, used to track its sync state
+        """
+        if bot_name in self._ready_hooked:
+            return
+        self._ready_hooked[bot_name] = bot
+        
+        async def on_ready():
+            if bot_name in self._sync_done:
+                return
+            # Claim before awaiting so overlapping ready events don't sync twice
+            self._sync_done.add(bot_name)
+            try:
+                await self.setup_commands(bot)
+            except CommandError:
+                # Already logged by setup_commands; retry on the next reconnect
+                self._sync_done.discard(bot_name)
+                return
+            except BaseException:
+                # Unexpected errors and cancellation must not leave the bot marked as synced
+                self._sync_done.discard(bot_name)
+                raise
+            logger.info("Commands synced for bot %s", bot_name)
+            
+        bot.add_listener(on_ready, 'on_ready')
+        
+    def resync(self, bot_name: str) -> None:
+        """
+        Sync a bot's commands again the next time it is ready.
+        
+        The recorded tree hashes are dropped too, so the sync is sent even if
+        the tree is unchanged.
+        
+        Args:
+            bot_name: Name of the bot
+        """
+        self._sync_done.discard(bot_name)
+        bot = self._ready_hooked.get(bot_name)
+        if bot is not None:
+            application = _sync_target(bot)[0]
+            for target in [target for target in self._tree_hashes if target[0] == application]:
+                del self._tree_hashes[target]
+        
+    async def _sync_guild_logged(self, bot: discord.Client, guild_id: int) -> bool:
+        """
+        Sync one guild, logging failures so the other guild syncs keep running.
         
+        Returns:
+            bool: False if the guild sync failed or was skipped
+        """
+        try:
+            return await self.sync_commands(bot, guild_id)
+        except CommandError as e:
+            logger.error("Failed to sync commands for guild %s: %s", guild_id, e)
+            return False
+            
     async def setup_commands(self, bot: discord.Client) -> None:
         """
         Set up all commands during bot initialization.
         
         Args:
             bot: Discord bot instance
+            
+        Raises:
+            CommandError: If any sync target failed or was skipped
         """
         try:
             # For development, sync to specific guilds
             if is_development():
-                guild_ids = settings.GUILD_IDS
-                if guild_ids:
-                    for guild_id in guild_ids:
-                        guild = bot.get_guild(guild_id)
-                        if guild:
-                            logger.info(f"Syncing commands for guild: {guild.name}")
-                            await self.sync_commands(bot, guild_id)
-                        else:
-                            logger.warning(f"Could not find guild with ID {guild_id}")
-                            
-            # Always sync globally for production
-            await self.sync_commands(bot)
+                guild_ids = []
+                for guild_id in _GUILD_IDS:
+                    guild = bot.get_guild(guild_id)
+                    if guild:
+                        logger.info("Syncing commands for guild: %s", guild.name)
+                        guild_ids.append(guild_id)
+                    else:
+                        logger.warning("Could not find guild with ID %s", guild_id)
+                        
+                # Sync guilds concurrently; cancelling setup cancels every guild sync
+                if hasattr(asyncio, 'TaskGroup'):
+                    async with asyncio.TaskGroup() as tg:
+                        tasks = [tg.create_task(self._sync_guild_logged(bot, guild_id)) for guild_id in guild_ids]
+                    results = [task.result() for task in tasks]
+                else:
+                    results = await asyncio.gather(*(self._sync_guild_logged(bot, guild_id) for guild_id in guild_ids))
+                    
+                failed = results.count(False)
+                if failed:
+                    raise CommandError(f"{failed} of {len(guild_ids)} guild syncs failed or were skipped")
+                        
+            else:
+                # Production syncs globally; dev guilds already get a copy above
+                if not await self.sync_commands(bot):
+                    raise CommandError("Global sync skipped by cooldown or rate limit")
             
-        except Exception as e:
-            logger.error(f"Error setting up commands: {e}", exc_info=True)
-            raise CommandError(f"Failed to set up commands: {str(e)}")
+        except (discord.HTTPException, CommandError) as e:
+            logger.exception("Error setting up commands: %s", e)
+            raise CommandError(f"Failed to set up commands: {str(e)}") from e
 
 # Global command sync instance
 command_sync = CommandSync()
\ No newline at end of file
@@ -28,7 +28,6 @@ Classes:
 """
 
 import logging
-import traceback
 import discord
 from discord import app_commands
 from typing import Optional, Dict, Any
@@ -271,12 +270,13 @@ class ErrorHandler:
         error_details = {
             'error_type': type(error).__name__,
             'error_message': str(error),
-            'stack_trace': traceback.format_exc(),
             **(context or {})
         }
         
+        # Pass the exception itself so the traceback is only formatted if a handler emits the record
         logger.error(
             "Error occurred",
+            exc_info=error,
             extra={
                 'error': str(error),
                 'details': error_details
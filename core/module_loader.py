@@ -22,6 +22,8 @@ Classes:
 """
 
 import os
+import sys
+import types
 import importlib
 import logging
 import inspect
@@ -166,9 +168,7 @@ class ModuleLoader:
                     
                     logger.debug(f"Successfully called setup function for module: {module_name}")
                 except Exception as e:
-                    logger.error(f"Error in setup function for module {module_name}: {str(e)}")
-                    import traceback
-                    logger.error(f"Exception traceback: {traceback.format_exc()}")
+                    logger.exception("Error in setup function for module %s: %s", module_name, e)
                     return False
                 
                 # Track new commands
@@ -183,9 +183,7 @@ class ModuleLoader:
                 logger.error(f"Module {module_name} does not have a setup function")
                 return False
         except Exception as e:
-            logger.error(f"Error loading module {module_name}: {str(e)}")
-            import traceback
-            logger.error(f"Exception traceback: {traceback.format_exc()}")
+            logger.exception("Error loading module %s: %s", module_name, e)
             return False
     
     def reload_module(self, bot, module_name):
@@ -273,8 +271,6 @@ class ModuleLoader:
                 
                 settings_manager = get_manager(module_name, DEFAULT_CONFIG)
                 
-                import sys
-                import types
                 config_module = types.ModuleType(f'config.{module_name}_config')
                 config_module.settings_manager = settings_manager
                 sys.modules[f'config.{module_name}_config'] = config_module
@@ -282,9 +278,7 @@ class ModuleLoader:
                 
             return True
         except Exception as e:
-            logger.error(f"Error setting up configuration for {module_name}: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error setting up configuration for %s: %s", module_name, e)
             return False
     
     def _diagnose_import_failure(self, module_name, error):
@@ -9,13 +9,17 @@ critical:
 
 import logging
 import os
-from typing import Dict, Set, List, Optional, Union
+import time
+from typing import Dict, Set, List, Optional, Tuple, Union
 from dataclasses import dataclass
 import discord
 from discord import Member, Role, Permissions as DiscordPermissions
 
 logger = logging.getLogger(__name__)
 
+# Seconds a cached permission check stays valid, bounding staleness after role changes
+PERMISSION_CACHE_TTL = 30.0
+
 @dataclass
 class Permission:
     """
@@ -48,14 +52,14 @@ class PermissionManager:
         permissions: Registered permissions
         role_permissions: Mapping of role IDs to their granted permissions
         role_denials: Mapping of role IDs to their explicitly denied permissions
-        permission_cache: Cache of permission checks for performance
+        permission_cache: Cache of permission checks keyed by (guild, member, permission), with monotonic expiry
     """
     
     def __init__(self):
         self.permissions: Dict[str, Permission] = {}
         self.role_permissions: Dict[int, Set[str]] = {}
         self.role_denials: Dict[int, Set[str]] = {}
-        self.permission_cache: Dict[str, bool] = {}
+        self.permission_cache: Dict[Tuple[int, int, str], Tuple[float, bool]] = {}
         
     def register_permission(self, permission: Permission) -> None:
         """
@@ -144,13 +148,29 @@ class PermissionManager:
             bool: Whether the member has the permission
         """
         # Check cache first
-        cache_key = f"{member.id}:{permission_name}"
-        if cache_key in self.permission_cache:
-            return self.permission_cache[cache_key]
+        cache_key = (member.guild.id, member.id, permission_name)
+        now = time.monotonic()
+        cached = self.permission_cache.get(cache_key)
+        if cached and cached[0] > now:
+            return cached[1]
             
+        result = self._check_permission(member, permission_name)
+        self.permission_cache[cache_key] = (now + PERMISSION_CACHE_TTL, result)
+        return result
+        
+    def _check_permission(self, member: Member, permission_name: str) -> bool:
+        """
+        Check a member's permission against their current roles, bypassing the cache.
+        
+        Args:
+            member: The Discord member
+            permission_name: The permission to check
+            
+        Returns:
+            bool: Whether the member has the permission
+        """
         # Server administrators always have all permissions
         if member.guild_permissions.administrator:
-            self.permission_cache[cache_key] = True
             return True
             
         # Check for explicit denials first (they take precedence)
@@ -158,7 +178,6 @@ class PermissionManager:
             if role.id in self.role_denials:
                 denied_perms = self.role_denials[role.id]
                 if self._matches_permission(permission_name, denied_perms):
-                    self.permission_cache[cache_key] = False
                     return False
                     
         # Then check for granted permissions
@@ -166,11 +185,9 @@ class PermissionManager:
             if role.id in self.role_permissions:
                 granted_perms = self.role_permissions[role.id]
                 if self._matches_permission(permission_name, granted_perms):
-                    self.permission_cache[cache_key] = True
                     return True
                     
         # No matching permissions found
-        self.permission_cache[cache_key] = False
         return False
         
     def _matches_permission(self, permission: str, permission_set: Set[str]) -> bool:
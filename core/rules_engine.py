@@ -19,6 +19,7 @@ Classes:
     RuleManager: Feature-specific rule management system
 """
 
+import asyncio
 import json
 import os
 import logging
@@ -43,6 +44,7 @@ class RuleManager:
         feature_id (str): Unique identifier for the feature
         data_dir (Path): Directory for rule storage
         rules (dict): Current rule configurations
+        _ids_by_name (dict): Rule IDs keyed by lower-cased rule ID and name
         file_path (Path): Path to rule JSON file
         
     Critical:
@@ -68,6 +70,8 @@ class RuleManager:
         self.feature_id = feature_id
         self.data_dir = Path(data_dir)
         self.rules = {}
+        self._ids_by_name = {}
+        self._name_index_dirty = True
         self.file_path = self.data_dir / f"{feature_id}_rules.json"
         
         os.makedirs(self.data_dir, exist_ok=True)
@@ -85,6 +89,7 @@ class RuleManager:
         Note:
             Failures are logged and result in empty rules
         """
+        self._name_index_dirty = True
         if self.file_path.exists():
             try:
                 with open(self.file_path, 'r') as f:
@@ -112,17 +117,52 @@ class RuleManager:
         Note:
             Uses JSON indentation for readability
         """
+        try:
+            payload = json.dumps(self.rules, indent=2)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Error serializing rules for '{self.feature_id}': {e}")
+            return False
+        return self._write_rules(payload, len(self.rules))
+    
+    async def save_rules_async(self) -> bool:
+        """
+        Save rules without blocking the event loop.
+        
+        The rules are serialized on the loop so the worker thread never
+        reads them while a command is mutating them.
+        
+        Returns:
+            bool: True if save successful, False otherwise
+        """
+        try:
+            payload = json.dumps(self.rules, indent=2)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Error serializing rules for '{self.feature_id}': {e}")
+            return False
+        return await asyncio.to_thread(self._write_rules, payload, len(self.rules))
+    
+    def _write_rules(self, payload: str, count: int) -> bool:
+        """
+        Write serialized rules to the JSON file.
+        
+        Args:
+            payload (str): The serialized rules
+            count (int): Number of rules, for logging
+            
+        Returns:
+            bool: True if save successful, False otherwise
+        """
         try:
             os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
             with open(self.file_path, 'w') as f:
-                json.dump(self.rules, f, indent=2)
-            logger.info(f"Saved {len(self.rules)} rules for feature '{self.feature_id}'")
+                f.write(payload)
+            logger.info(f"Saved {count} rules for feature '{self.feature_id}'")
             return True
         except Exception as e:
             logger.error(f"Error saving rules for '{self.feature_id}': {e}")
             return False
     
-    def add_rule(self, rule_id: str, rule_data: dict) -> bool:
+    def add_rule(self, rule_id: str, rule_data: dict, save: bool = True) -> bool:
         """
         Add or update a rule.
         
@@ -134,6 +174,7 @@ class RuleManager:
         Args:
             rule_id (str): Unique identifier for the rule
             rule_data (dict): Rule configuration data
+            save (bool, optional): Whether to save to disk immediately
             
         Returns:
             bool: True if operation successful
@@ -141,10 +182,15 @@ class RuleManager:
         Note:
             Overwrites existing rule if ID exists
         """
+        # Check before inserting, otherwise every rule looks like an update
+        is_new = rule_id not in self.rules
         self.rules[rule_id] = rule_data
-        return self.save_rules()
+        self._name_index_dirty = True
+        logger.info("%s rule '%s' for feature '%s'", "Created" if is_new else "Updated",
+                    rule_id, self.feature_id)
+        return self.save_rules() if save else True
     
-    def remove_rule(self, rule_id: str) -> bool:
+    def remove_rule(self, rule_id: str, save: bool = True) -> bool:
         """
         Remove a rule by ID.
         
@@ -155,6 +201,7 @@ class RuleManager:
         
         Args:
             rule_id (str): ID of rule to remove
+            save (bool, optional): Whether to save to disk immediately
             
         Returns:
             bool: True if rule removed, False if not found
@@ -162,12 +209,12 @@ class RuleManager:
         Note:
             Returns False if rule doesn't exist
         """
-        if rule_id in self.rules:
-            del self.rules[rule_id]
-            return self.save_rules()
-        return False
+        if self.rules.pop(rule_id, None) is None:
+            return False
+        self._name_index_dirty = True
+        return self.save_rules() if save else True
     
-    def update_rule(self, rule_id: str, **updates) -> bool:
+    def update_rule(self, rule_id: str, save: bool = True, **updates) -> bool:
         """
         Update specific fields of a rule.
         
@@ -179,6 +226,7 @@ class RuleManager:
         
         Args:
             rule_id (str): ID of rule to update
+            save (bool, optional): Whether to save to disk immediately
             **updates: Field updates as keyword arguments
             
         Returns:
@@ -203,7 +251,35 @@ class RuleManager:
             else:
                 self.rules[rule_id][key] = value
         
-        return self.save_rules()
+        if 'name' in updates:
+            self._name_index_dirty = True
+        return self.save_rules() if save else True
+    
+    def find_rule_id(self, key: str):
+        """
+        Resolve a rule ID from an ID or rule name, case-insensitively.
+        
+        Args:
+            key (str): Rule ID or name
+            
+        Returns:
+            str: The matching rule ID, or None if no rule matches
+            
+        Note:
+            Exact IDs are checked first; the name index is rebuilt
+            lazily after rules are added, removed or renamed
+        """
+        if key in self.rules:
+            return key
+        if self._name_index_dirty:
+            ids_by_name = {}
+            for rule_id, rule in self.rules.items():
+                ids_by_name.setdefault(rule_id.lower(), rule_id)
+                if isinstance(rule, dict) and rule.get('name'):
+                    ids_by_name.setdefault(rule['name'].lower(), rule_id)
+            self._ids_by_name = ids_by_name
+            self._name_index_dirty = False
+        return self._ids_by_name.get(key.lower())
     
     def get_rule(self, rule_id: str) -> dict:
         """
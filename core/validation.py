@@ -72,7 +72,7 @@ class InputValidator:
         # Parse and validate URL components
         try:
             parsed = urllib.parse.urlparse(url)
-            if not all([parsed.scheme, parsed.netloc]):
+            if not (parsed.scheme and parsed.netloc):
                 raise ValidationError("Invalid URL components")
         except Exception as e:
             raise ValidationError(f"URL parsing error: {str(e)}")
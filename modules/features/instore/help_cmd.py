@@ -19,14 +19,11 @@ async def handle_instore_help(interaction):
     Args:
         interaction: The Discord interaction
     """
-    embed = discord.Embed(
+    embed = embed_config.create_embed(
         title="In-store Module Help",
         description="The In-store module provides functionality for tracking in-store product availability and events."
     )
     
-    # Apply styling from embed_config
-    embed = embed_config.apply_default_styling(embed)
-    
     # Add placeholder information
     embed.add_field(
         name="🏬 In-store Monitoring",
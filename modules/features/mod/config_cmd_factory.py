@@ -0,0 +1,187 @@
+"""
+Config Command Factory
+
+This module builds the `/<feature>-config` slash commands from a setting spec,
+so each feature only describes its settings instead of repeating the
+parse → update → save → reply flow.
+"""
+
+import asyncio
+import logging
+import discord
+from pathlib import Path
+from discord import app_commands
+from utils.permissions import mod_only
+from utils.helpers import parse_id_list
+
+logger = logging.getLogger('discord_bot.modules.mod.config_cmd_factory')
+
+TRUE_VALUES = ('true', '1', 't', 'yes', 'y', 'on', 'enable')
+FALSE_VALUES = ('false', '0', 'f', 'no', 'n', 'off', 'disable')
+
+def parse_bool(value):
+    """
+    Parse a true/false setting value.
+
+    Args:
+        value (str): The value to parse
+
+    Returns:
+        bool: The parsed value
+
+    Raises:
+        ValueError: If the value is not a recognised boolean
+    """
+    lowered = value.lower()
+    if lowered in TRUE_VALUES:
+        return True
+    if lowered in FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {value}")
+
+# Setting kinds: kind -> (parser, renderer, .env formatter, missing value prompt, invalid value message, update message)
+# The renderer turns the parsed value into its display form once; the .env value and reply are built from it
+SETTING_KINDS = {
+    "id_list": (
+        parse_id_list,
+        lambda ids: [str(item_id) for item_id in ids],
+        ",".join,
+        "Please provide {label} separated by commas. Example: `123456789,987654321`",
+        "Invalid {label}. Please provide numbers only, separated by commas.",
+        lambda label, ids, shown: f"Updated {label} to: {', '.join(shown)}"
+    ),
+    "bool": (
+        parse_bool,
+        str,
+        str,
+        "Please provide 'true' or 'false' to enable or disable {label}",
+        "Invalid value. Please use 'true' or 'false'.",
+        lambda label, enabled, shown: f"{label[:1].upper()}{label[1:]} has been {'enabled' if enabled else 'disabled'}."
+    )
+}
+
+async def update_env_values(updates):
+    """
+    Update values in the .env file without blocking the event loop.
+
+    Interaction handlers defer before calling this, so the acknowledgement
+    doesn't wait on the write.
+
+    Args:
+        updates: Mapping of keys to their new values
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return await asyncio.to_thread(_write_env_values, updates)
+
+def _write_env_values(updates):
+    """
+    Rewrite the .env file once with all updated values.
+
+    Args:
+        updates: Mapping of keys to their new values
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        env_path = Path('.env')
+        lines = env_path.read_text().splitlines(keepends=True) if env_path.exists() else []
+
+        # Update the keys that already exist
+        remaining = dict(updates)
+        for i, line in enumerate(lines):
+            if line.strip() and not line.strip().startswith('#'):
+                key = line.split('=')[0].strip()
+                if key in remaining:
+                    lines[i] = f"{key}={remaining.pop(key)}\n"
+
+        # Add any keys that weren't found
+        if lines and not lines[-1].endswith('\n'):
+            lines[-1] += '\n'
+        for key, value in remaining.items():
+            lines.append(f"{key}={value}\n")
+
+        env_path.write_text(''.join(lines))
+        logger.info("Updated %s in .env file", ", ".join(updates))
+        return True
+
+    except Exception as e:
+        logger.error(f"Error updating .env file: {str(e)}")
+        return False
+
+def make_setting_handlers(schema, update_config):
+    """
+    Build one handler per setting from a spec.
+
+    The spec is resolved here, once, so each handler only parses the value and
+    applies it.
+
+    Args:
+        schema: Mapping of setting name -> {"kind", "env", "key", "label"}
+        update_config: Coroutine taking a mapping of config keys to new values
+
+    Returns:
+        dict: Mapping of setting name -> async handler(interaction, value)
+    """
+    handlers = {}
+
+    for setting, spec in schema.items():
+        parse, render, to_env, missing, invalid, updated = SETTING_KINDS[spec["kind"]]
+        label = spec["label"]
+
+        async def handler(interaction, value, *, parse=parse, render=render, to_env=to_env,
+                          missing=missing.format(label=label),
+                          invalid=invalid.format(label=label),
+                          updated=updated, label=label,
+                          env_key=spec["env"], config_key=spec["key"]):
+            if not value:
+                await interaction.response.send_message(missing, ephemeral=True)
+                return
+
+            try:
+                parsed = parse(value)
+            except ValueError:
+                await interaction.response.send_message(invalid, ephemeral=True)
+                return
+
+            await interaction.response.defer(ephemeral=True)
+            shown = render(parsed)
+            if not await update_env_values({env_key: to_env(shown)}):
+                await interaction.followup.send(
+                    f"Failed to update {label}. Check the logs for more information.",
+                    ephemeral=True
+                )
+                return
+            await update_config({config_key: parsed})
+            await interaction.followup.send(updated(label, parsed, shown), ephemeral=True)
+
+        handlers[setting] = handler
+
+    return handlers
+
+def make_config_command(name, description, handler, setting_help, value_help="The new value for the setting"):
+    """
+    Build a mod-only `/<name> [setting] [value]` slash command.
+
+    Args:
+        name: The command name
+        description: The command description
+        handler: Coroutine taking (interaction, setting, value)
+        setting_help: Description of the setting parameter
+        value_help: Description of the value parameter
+
+    Returns:
+        app_commands.Command: The command, ready for bot.tree.add_command
+    """
+    async def config_command(interaction: discord.Interaction, setting: str = None, value: str = None):
+        await handler(interaction, setting, value)
+
+    command = app_commands.Command(
+        name=name,
+        description=description,
+        callback=config_command
+    )
+    app_commands.describe(setting=setting_help, value=value_help)(command)
+    return mod_only()(command)
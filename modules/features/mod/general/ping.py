@@ -5,7 +5,6 @@ A simple ping command to check if the bot is responsive.
 """
 
 import logging
-import time
 import discord
 from discord import app_commands
 
@@ -18,15 +17,11 @@ async def ping_command(interaction: discord.Interaction):
     Args:
         interaction: The Discord interaction
     """
-    # Calculate latency
-    start_time = time.time()
-    await interaction.response.defer(ephemeral=False)
-    end_time = time.time()
-    
-    latency = round((end_time - start_time) * 1000)
+    # Use the gateway latency so the reply takes a single response call
+    latency = round(interaction.client.latency * 1000)
     
     # Send response
-    await interaction.followup.send(f"Pong! 🏓 Latency: {latency}ms")
+    await interaction.response.send_message(f"Pong! 🏓 Latency: {latency}ms")
     
     logger.debug(f"Ping command executed by {interaction.user} with latency {latency}ms")
 
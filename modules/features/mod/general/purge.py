@@ -27,7 +27,7 @@ async def handle_purge(interaction, count):
         user_role_ids = {role.id for role in interaction.user.roles}
         
         # Check if any of the user's roles is in the whitelist
-        has_whitelisted_role = any(role_id in user_role_ids for role_id in mod.WHITELIST_ROLE_IDS)
+        has_whitelisted_role = not user_role_ids.isdisjoint(mod.WHITELIST_ROLE_IDS)
         
         if not has_whitelisted_role:
             await interaction.response.send_message(
@@ -72,7 +72,7 @@ async def handle_purge(interaction, count):
             ephemeral=True
         )
         
-        logger.info(f"User {interaction.user} purged {len(deleted)} messages in channel {interaction.channel.name}")
+        logger.info("User %s purged %s messages in channel %s", interaction.user, len(deleted), interaction.channel.name)
     except discord.Forbidden:
         await interaction.followup.send(
             "I don't have permission to delete messages in this channel.",
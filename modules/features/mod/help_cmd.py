@@ -19,14 +19,11 @@ async def handle_mod_help(interaction):
     Args:
         interaction: The Discord interaction
     """
-    embed = discord.Embed(
+    embed = embed_config.create_embed(
         title="Mod Module Help",
         description="The Mod module provides moderation and management tools for your Discord server."
     )
     
-    # Apply styling from embed_config
-    embed = embed_config.apply_default_styling(embed)
-    
     # Add general information
     embed.add_field(
         name="🔄 Reaction System",
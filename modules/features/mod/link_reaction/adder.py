@@ -5,8 +5,10 @@ This module provides functionality for adding PIDs to the LuisaViaRoma tracking
 """
 
 import os
+import asyncio
 import logging
 from config.features.reactions import link as link_reaction_config
+from modules.features.mod.link_reaction.store_manager import ensure_store_dir
 
 logger = logging.getLogger('discord_bot.modules.mod.link_reaction.adder')
 
@@ -23,20 +25,7 @@ async def add_pid_to_file(pid, channel=None):
         str: Message describing the result
     """
     # Get LuisaViaRoma store configuration
-    stores = link_reaction_config.settings_manager.get("STORES", {})
-    
-    # Check if we're using the new dictionary format or legacy list format
-    store_config = None
-    
-    if isinstance(stores, dict):
-        # Dictionary format (new)
-        store_config = stores.get("luisaviaroma", {})
-    elif isinstance(stores, list):
-        # List format (legacy)
-        for store in stores:
-            if isinstance(store, dict) and store.get('name', '').lower() == "luisaviaroma":
-                store_config = store
-                break
+    store_config = link_reaction_config.get_store("luisaviaroma")
     
     if not store_config:
         message = "❌ LuisaViaRoma store not configured."
@@ -51,9 +40,24 @@ async def add_pid_to_file(pid, channel=None):
         logger.error(message)
         return False, message
     
+    # File I/O runs in a worker thread so a slow disk doesn't stall the event loop
+    return await asyncio.to_thread(_append_pid, file_path, pid)
+
+def _append_pid(file_path, pid):
+    """
+    Append a PID to the tracking file unless it is already listed
+    
+    Args:
+        file_path: Path to the LuisaViaRoma tracking file
+        pid: The product ID to add
+    
+    Returns:
+        bool: True if the PID was added, False otherwise
+        str: Message describing the result
+    """
     # Create directory if it doesn't exist
     try:
-        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        ensure_store_dir(file_path)
     except Exception as e:
         message = f"❌ Error creating directory: {str(e)}"
         logger.error(message)
@@ -8,12 +8,30 @@ import discord
 from discord import app_commands
 import logging
 from utils.permissions import mod_only
-from .store_manager import StoreManager
+from .store_manager import store_manager
 from .adder import add_pid_to_file
 from .remover import remove_pid_from_file
 
 logger = logging.getLogger('discord_bot.modules.mod.link_reaction.commands')
 
+async def _update_tracking_list(interaction: discord.Interaction, pid: str, action):
+    """
+    Apply a tracking list action for a LuisaViaRoma product ID and report the result.
+    
+    Args:
+        interaction: The Discord interaction
+        pid: The product ID to add or remove
+        action: add_pid_to_file or remove_pid_from_file
+    """
+    await interaction.response.defer(ephemeral=True)
+    
+    if not store_manager.get_store("luisaviaroma"):
+        await interaction.followup.send("❌ LuisaViaRoma store not configured.", ephemeral=True)
+        return
+        
+    success, message = await action(pid.strip(), interaction.channel)
+    await interaction.followup.send(message, ephemeral=True)
+
 def setup_commands(bot):
     """Register link reaction commands."""
     
@@ -33,18 +51,7 @@ def setup_commands(bot):
             interaction: The Discord interaction
             pid: The product ID to add
         """
-        await interaction.response.defer(ephemeral=True)
-        
-        # Get store manager
-        store_manager = StoreManager()
-        store_config = store_manager.get_store("luisaviaroma")
-        
-        if not store_config:
-            await interaction.followup.send("❌ LuisaViaRoma store not configured.", ephemeral=True)
-            return
-            
-        success, message = await add_pid_to_file(pid.strip(), interaction.channel)
-        await interaction.followup.send(message, ephemeral=True)
+        await _update_tracking_list(interaction, pid, add_pid_to_file)
     
     @bot.tree.command(
         name="luisaviaroma_remover",
@@ -62,15 +69,4 @@ def setup_commands(bot):
             interaction: The Discord interaction
             pid: The product ID to remove
         """
-        await interaction.response.defer(ephemeral=True)
-        
-        # Get store manager
-        store_manager = StoreManager()
-        store_config = store_manager.get_store("luisaviaroma")
-        
-        if not store_config:
-            await interaction.followup.send("❌ LuisaViaRoma store not configured.", ephemeral=True)
-            return
-            
-        success, message = await remove_pid_from_file(pid.strip(), interaction.channel)
-        await interaction.followup.send(message, ephemeral=True) 
\ No newline at end of file
+        await _update_tracking_list(interaction, pid, remove_pid_from_file) 
\ No newline at end of file
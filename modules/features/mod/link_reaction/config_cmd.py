@@ -9,13 +9,20 @@ import discord
 from discord import app_commands
 import logging
 import os
+from datetime import datetime
 from config import link_reaction_config as config
-from modules.features.mod.link_reaction.store_manager import store_manager
+from modules.features.mod.link_reaction.store_manager import store_manager, URL_PID_PATTERN
 from config.features.embed_config import embed as embed_config
 from utils.permissions import check_interaction_permissions
 
 logger = logging.getLogger('discord_bot.modules.mod.link_reaction.config_cmd')
 
+# Store status labels, keyed by the store's enabled flag
+_STORE_STATUS = {True: "✅ Enabled", False: "❌ Disabled"}
+
+# Rendered "view" embeds: guild_id -> (config revision, embed dict)
+_view_cache = {}
+
 @app_commands.command(
     name="link-reaction-config",
     description="Configure the link reaction feature and manage store settings"
@@ -63,11 +70,13 @@ async def link_reaction_config(
         await show_config(interaction)
     elif action == "enable":
         # Enable the link reaction feature
-        config.ENABLED = True
+        config.set("ENABLED", True, save=False)
+        config.schedule_save()
         await interaction.response.send_message("✅ Link reaction feature enabled.")
     elif action == "disable":
         # Disable the link reaction feature
-        config.ENABLED = False
+        config.set("ENABLED", False, save=False)
+        config.schedule_save()
         await interaction.response.send_message("✅ Link reaction feature disabled.")
     elif action == "categories":
         # Handle category configuration
@@ -81,61 +90,66 @@ async def link_reaction_config(
     else:
         await interaction.response.send_message(f"❌ Unknown action: {action}. Use 'view', 'enable', 'disable', 'categories', 'blacklist', or 'stores'.", ephemeral=True)
 
+def format_ids(ids, resolve):
+    """
+    Format IDs as "name (id)" lines.
+    
+    Args:
+        ids: The channel, category or role IDs
+        resolve: A guild cache lookup such as guild.get_channel or guild.get_role
+    
+    Returns:
+        str: One line per ID, "Unknown (id)" if it can't be resolved; empty if there are no IDs
+    """
+    return "\n".join(
+        f"{obj.name} ({obj_id})" if (obj := resolve(obj_id)) else f"Unknown ({obj_id})"
+        for obj_id in ids
+    )
+
 async def show_config(interaction):
-    """Show the current configuration."""
+    """Show the current configuration, reusing the last render until the config changes."""
+    guild_id = interaction.guild.id
+    cached = _view_cache.get(guild_id)
+    if cached and cached[0] == config.revision:
+        embed = discord.Embed.from_dict(cached[1])
+        if embed_config.INCLUDE_TIMESTAMP:
+            embed.timestamp = datetime.now()
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return
+    
     # Create an embed with the current configuration
-    embed = discord.Embed(
+    embed = embed_config.create_embed(
         title="Link Reaction Configuration",
-        description="Current settings for the link reaction feature.",
-        color=discord.Color.blue()
+        description="Current settings for the link reaction feature."
     )
     
     # Add basic configuration fields
     embed.add_field(name="Status", value="Enabled ✅" if config.ENABLED else "Disabled ❌", inline=False)
     
     # Add category information
-    category_list = []
-    for cat_id in config.CATEGORY_IDS:
-        category = interaction.guild.get_channel(cat_id)
-        if category:
-            category_list.append(f"{category.name} ({cat_id})")
-        else:
-            category_list.append(f"Unknown ({cat_id})")
+    category_list = format_ids(config.CATEGORY_IDS, interaction.guild.get_channel)
     
     if category_list:
-        embed.add_field(name="Monitored Categories", value="\n".join(category_list), inline=False)
+        embed.add_field(name="Monitored Categories", value=category_list, inline=False)
     
     # Add blacklist information
-    blacklist_items = []
-    for channel_id in config.BLACKLIST_CHANNEL_IDS:
-        channel = interaction.guild.get_channel(channel_id)
-        if channel:
-            blacklist_items.append(f"{channel.name} ({channel_id})")
-        else:
-            blacklist_items.append(f"Unknown ({channel_id})")
+    blacklist_items = format_ids(config.BLACKLIST_CHANNEL_IDS, interaction.guild.get_channel)
     
     if blacklist_items:
-        embed.add_field(name="Blacklisted Channels", value="\n".join(blacklist_items), inline=False)
+        embed.add_field(name="Blacklisted Channels", value=blacklist_items, inline=False)
     
     # Add link emoji
     embed.add_field(name="Link Emoji", value=config.LINK_EMOJI, inline=False)
     
     # Add whitelist roles
-    role_list = []
-    for role_id in config.WHITELIST_ROLE_IDS:
-        role = interaction.guild.get_role(role_id)
-        if role:
-            role_list.append(f"{role.name} ({role_id})")
-        else:
-            role_list.append(f"Unknown ({role_id})")
+    role_list = format_ids(config.get("WHITELIST_ROLE_IDS", []), interaction.guild.get_role)
     
     if role_list:
-        embed.add_field(name="Whitelisted Roles", value="\n".join(role_list), inline=False)
+        embed.add_field(name="Whitelisted Roles", value=role_list, inline=False)
     else:
         embed.add_field(name="Whitelisted Roles", value="None (all users can use the feature)", inline=False)
     
-    # Apply default styling to the embed
-    embed = embed_config.apply_default_styling(embed)
+    _view_cache[guild_id] = (config.revision, embed.to_dict())
     
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -154,10 +168,8 @@ async def handle_categories(interaction, setting, value):
                 return
             
             # Add the category to the whitelist
-            config.CATEGORY_IDS.append(category.id)
-            
-            # Save the updated configuration
-            # TODO: Save to .env file or database
+            config.set("CATEGORY_IDS", [*config.CATEGORY_IDS, category.id], save=False)
+            config.schedule_save()
             
             await interaction.response.send_message(f"✅ Added category {category.name} to the whitelist.")
         except Exception as e:
@@ -177,10 +189,8 @@ async def handle_categories(interaction, setting, value):
                 return
             
             # Remove the category from the whitelist
-            config.CATEGORY_IDS.remove(category.id)
-            
-            # Save the updated configuration
-            # TODO: Save to .env file or database
+            config.set("CATEGORY_IDS", [cid for cid in config.CATEGORY_IDS if cid != category.id], save=False)
+            config.schedule_save()
             
             await interaction.response.send_message(f"✅ Removed category {category.name} from the whitelist.")
         except Exception as e:
@@ -189,16 +199,10 @@ async def handle_categories(interaction, setting, value):
     
     elif setting == "list":
         # List whitelisted categories
-        category_list = []
-        for cat_id in config.CATEGORY_IDS:
-            category = interaction.guild.get_channel(cat_id)
-            if category:
-                category_list.append(f"{category.name} ({cat_id})")
-            else:
-                category_list.append(f"Unknown ({cat_id})")
+        category_list = format_ids(config.CATEGORY_IDS, interaction.guild.get_channel)
         
         if category_list:
-            await interaction.response.send_message(f"Whitelisted Categories:\n{chr(10).join(category_list)}")
+            await interaction.response.send_message(f"Whitelisted Categories:\n{category_list}")
         else:
             await interaction.response.send_message("No categories in the whitelist.")
     
@@ -220,10 +224,8 @@ async def handle_blacklist(interaction, setting, value):
                 return
             
             # Add the channel to the blacklist
-            config.BLACKLIST_CHANNEL_IDS.append(channel.id)
-            
-            # Save the updated configuration
-            # TODO: Save to .env file or database
+            config.set("BLACKLIST_CHANNEL_IDS", [*config.BLACKLIST_CHANNEL_IDS, channel.id], save=False)
+            config.schedule_save()
             
             await interaction.response.send_message(f"✅ Added channel {channel.name} to the blacklist.")
         except Exception as e:
@@ -243,10 +245,8 @@ async def handle_blacklist(interaction, setting, value):
                 return
             
             # Remove the channel from the blacklist
-            config.BLACKLIST_CHANNEL_IDS.remove(channel.id)
-            
-            # Save the updated configuration
-            # TODO: Save to .env file or database
+            config.set("BLACKLIST_CHANNEL_IDS", [cid for cid in config.BLACKLIST_CHANNEL_IDS if cid != channel.id], save=False)
+            config.schedule_save()
             
             await interaction.response.send_message(f"✅ Removed channel {channel.name} from the blacklist.")
         except Exception as e:
@@ -255,16 +255,10 @@ async def handle_blacklist(interaction, setting, value):
     
     elif setting == "list":
         # List blacklisted channels
-        blacklist = []
-        for channel_id in config.BLACKLIST_CHANNEL_IDS:
-            channel = interaction.guild.get_channel(channel_id)
-            if channel:
-                blacklist.append(f"{channel.name} ({channel_id})")
-            else:
-                blacklist.append(f"Unknown ({channel_id})")
+        blacklist = format_ids(config.BLACKLIST_CHANNEL_IDS, interaction.guild.get_channel)
         
         if blacklist:
-            await interaction.response.send_message(f"Blacklisted Channels:\n{chr(10).join(blacklist)}")
+            await interaction.response.send_message(f"Blacklisted Channels:\n{blacklist}")
         else:
             await interaction.response.send_message("No channels in the blacklist.")
     
@@ -283,7 +277,11 @@ async def handle_stores(interaction, store_id, setting, value):
         await list_stores(interaction)
         return
     
-    if setting == "view" and store_id:
+    # Accept store names and any casing for existing stores
+    if setting != "add":
+        store_id = store_manager.resolve_store_id(store_id) or store_id
+    
+    if setting == "view":
         # View a specific store configuration
         await view_store(interaction, store_id)
         return
@@ -307,9 +305,10 @@ async def handle_stores(interaction, store_id, setting, value):
             detection_type="author_name",
             detection_value=value,
             extraction_primary="url",
-            extraction_pattern=r'\/[^\/]+\/([^\/]+)$',
-            description=f"Extract product IDs from {value} embeds"
-        )
+            extraction_pattern=URL_PID_PATTERN,
+            description=f"Extract product IDs from {value} embeds",
+            save=False
+        ) and await store_manager.save_async()
         
         if success:
             await interaction.response.send_message(f"✅ Added new store '{value}' with ID '{store_id}'.")
@@ -323,7 +322,7 @@ async def handle_stores(interaction, store_id, setting, value):
             await interaction.response.send_message(f"❌ Store with ID '{store_id}' does not exist.", ephemeral=True)
             return
         
-        success = store_manager.remove_store(store_id)
+        success = store_manager.remove_store(store_id, save=False) and await store_manager.save_async()
         if success:
             await interaction.response.send_message(f"✅ Removed store '{store['name']}' with ID '{store_id}'.")
         else:
@@ -336,7 +335,7 @@ async def handle_stores(interaction, store_id, setting, value):
             await interaction.response.send_message(f"❌ Store with ID '{store_id}' does not exist.", ephemeral=True)
             return
         
-        success = store_manager.update_store(store_id, enabled=True)
+        success = store_manager.update_store(store_id, enabled=True, save=False) and await store_manager.save_async()
         if success:
             await interaction.response.send_message(f"✅ Enabled store '{store['name']}' with ID '{store_id}'.")
         else:
@@ -349,7 +348,7 @@ async def handle_stores(interaction, store_id, setting, value):
             await interaction.response.send_message(f"❌ Store with ID '{store_id}' does not exist.", ephemeral=True)
             return
         
-        success = store_manager.update_store(store_id, enabled=False)
+        success = store_manager.update_store(store_id, enabled=False, save=False) and await store_manager.save_async()
         if success:
             await interaction.response.send_message(f"✅ Disabled store '{store['name']}' with ID '{store_id}'.")
         else:
@@ -366,7 +365,7 @@ async def handle_stores(interaction, store_id, setting, value):
             await interaction.response.send_message("❌ Please provide a new name for the store.", ephemeral=True)
             return
         
-        success = store_manager.update_store(store_id, name=value)
+        success = store_manager.update_store(store_id, name=value, save=False) and await store_manager.save_async()
         if success:
             await interaction.response.send_message(f"✅ Updated store name from '{store['name']}' to '{value}'.")
         else:
@@ -383,7 +382,7 @@ async def handle_stores(interaction, store_id, setting, value):
             await interaction.response.send_message("❌ Please provide a file path for the store.", ephemeral=True)
             return
         
-        success = store_manager.update_store(store_id, file_path=value)
+        success = store_manager.update_store(store_id, file_path=value, save=False) and await store_manager.save_async()
         if success:
             await interaction.response.send_message(f"✅ Updated file path for store '{store['name']}' to '{value}'.")
         else:
@@ -400,7 +399,7 @@ async def handle_stores(interaction, store_id, setting, value):
             await interaction.response.send_message("❌ Please provide a valid detection type: author_name, title_contains, or url_contains.", ephemeral=True)
             return
         
-        success = store_manager.update_store(store_id, detection_type=value)
+        success = store_manager.update_store(store_id, detection_type=value, save=False) and await store_manager.save_async()
         if success:
             await interaction.response.send_message(f"✅ Updated detection type for store '{store['name']}' to '{value}'.")
         else:
@@ -417,7 +416,7 @@ async def handle_stores(interaction, store_id, setting, value):
             await interaction.response.send_message("❌ Please provide a detection value for the store.", ephemeral=True)
             return
         
-        success = store_manager.update_store(store_id, detection_value=value)
+        success = store_manager.update_store(store_id, detection_value=value, save=False) and await store_manager.save_async()
         if success:
             await interaction.response.send_message(f"✅ Updated detection value for store '{store['name']}' to '{value}'.")
         else:
@@ -435,18 +434,13 @@ async def list_stores(interaction):
         return
     
     # Create an embed with the list of stores
-    embed = discord.Embed(
+    embed = embed_config.create_embed(
         title="Link Reaction Stores",
-        description="List of configured stores for link detection and info extraction.",
-        color=discord.Color.blue()
+        description="List of configured stores for link detection and info extraction."
     )
     
     for store_id, store_data in config.STORES.items():
-        if store_data.get('enabled', True):
-            status = "✅ Enabled"
-        else:
-            status = "❌ Disabled"
-        
+        status = _STORE_STATUS[bool(store_data.get('enabled', True))]
         store_name = store_data.get('name', 'Unnamed Store')
         detection_type = store_data.get('detection_type', 'domain')
         detection_value = store_data.get('detection_value', '')
@@ -457,9 +451,6 @@ async def list_stores(interaction):
     if not config.STORES:
         embed.description = "No stores configured yet."
     
-    # Apply default styling to the embed
-    embed = embed_config.apply_default_styling(embed)
-    
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
 async def view_store(interaction, store_id):
@@ -471,18 +462,12 @@ async def view_store(interaction, store_id):
         return
     
     # Create an embed with the store details
-    embed = discord.Embed(
+    embed = embed_config.create_embed(
         title=f"Store Details: {store['name']}",
-        description=f"Configuration for store ID: {store_id}",
-        color=discord.Color.blue()
+        description=f"Configuration for store ID: {store_id}"
     )
     
-    # Status
-    if store.get("enabled", True):
-        status = "✅ Enabled"
-    else:
-        status = "❌ Disabled"
-    embed.add_field(name="Status", value=status, inline=True)
+    embed.add_field(name="Status", value=_STORE_STATUS[bool(store.get("enabled", True))], inline=True)
     
     # Detection method
     detection_type = store.get("detection_type", "domain")
@@ -492,11 +477,9 @@ async def view_store(interaction, store_id):
     
     # Extraction 
     extraction = store.get("extraction", {})
-    extraction_text = ""
     
     if extraction:
-        for key, pattern in extraction.items():
-            extraction_text += f"**{key}**: `{pattern}`\n"
+        extraction_text = "\n".join(f"**{key}**: `{pattern}`" for key, pattern in extraction.items())
     else:
         extraction_text = "No extraction patterns configured"
     
@@ -509,29 +492,40 @@ async def view_store(interaction, store_id):
     else:
         embed.add_field(name="Storage File", value="Not configured", inline=False)
     
-    # Apply default styling to the embed
-    embed = embed_config.apply_default_styling(embed)
-    
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
+def parse_channel_id(value):
+    """
+    Parse a channel or category ID from a mention (<#id>) or a plain ID.
+    
+    Args:
+        value: The mention or ID
+    
+    Returns:
+        int: The ID, or None if the value isn't one
+    """
+    value = value.strip()
+    if value.startswith("<#") and value.endswith(">"):
+        value = value[2:-1]
+    return int(value) if value.isdecimal() else None
+
 async def resolve_category(interaction, value):
     """Resolve a category from a mention, ID, or name."""
     if not value:
         await interaction.response.send_message("❌ Please provide a category ID, name, or mention.", ephemeral=True)
         return None
     
-    # Try to resolve as ID
-    try:
-        category_id = int(value.strip())
+    # Try to resolve as mention or ID with a direct cache lookup
+    category_id = parse_channel_id(value)
+    if category_id is not None:
         category = interaction.guild.get_channel(category_id)
-        if category and isinstance(category, discord.CategoryChannel):
+        if isinstance(category, discord.CategoryChannel):
             return category
-    except ValueError:
-        pass
     
-    # Try to resolve as name
-    for category in interaction.guild.categories:
-        if category.name.lower() == value.lower():
+    # Fall back to a name scan; guild.categories would build and sort a new list first
+    name = value.lower()
+    for category in interaction.guild.channels:
+        if isinstance(category, discord.CategoryChannel) and category.name.lower() == name:
             return category
     
     await interaction.response.send_message(f"❌ Could not find category: {value}", ephemeral=True)
@@ -543,26 +537,18 @@ async def resolve_channel(interaction, value):
         await interaction.response.send_message("❌ Please provide a channel ID, name, or mention.", ephemeral=True)
         return None
     
-    # Try to resolve as mention
-    if value.startswith("<#") and value.endswith(">"):
-        channel_id = int(value[2:-1])
-        channel = interaction.guild.get_channel(channel_id)
+    # Try to resolve as mention or ID with a direct cache lookup, covering threads too
+    channel_id = parse_channel_id(value)
+    if channel_id is not None:
+        channel = interaction.guild.get_channel_or_thread(channel_id)
         if channel:
             return channel
     
-    # Try to resolve as ID
-    try:
-        channel_id = int(value.strip())
-        channel = interaction.guild.get_channel(channel_id)
-        if channel:
-            return channel
-    except ValueError:
-        pass
-    
-    # Try to resolve as name
+    # Fall back to a name scan
+    name = value.lower()
     for channel in interaction.guild.channels:
-        if channel.name.lower() == value.lower():
+        if channel.name.lower() == name:
             return channel
     
     await interaction.response.send_message(f"❌ Could not find channel: {value}", ephemeral=True)
-    return None 
\ No newline at end of file
+    return None
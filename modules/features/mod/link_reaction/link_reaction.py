@@ -12,7 +12,8 @@ import re
 from config.features.reactions import link as config
 from config.features import pinger_config
 from config.features.reactions import forward as forward_config
-from modules.features.mod.link_reaction.store_manager import store_manager
+from modules.features.mod.link_reaction.store_manager import store_manager, URL_PID_RE, ensure_store_dir
+from .commands import setup_commands
 
 # Keep asyncio import as it's used for the delay when adding reactions
 import asyncio
@@ -26,12 +27,13 @@ async def process_message(message):
     Args:
         message: The Discord message to process
     """
-    # Get settings directly from settings manager
-    enabled = config.settings_manager.get("ENABLED", False)
-    category_ids = config.settings_manager.get("CATEGORY_IDS", [])
-    blacklist_channel_ids = config.settings_manager.get("BLACKLIST_CHANNEL_IDS", [])
-    whitelist_role_ids = config.settings_manager.get("WHITELIST_ROLE_IDS", [])
-    stores = config.settings_manager.get("STORES", {})
+    # Read all settings from a single snapshot
+    settings = config.settings_manager.snapshot()
+    enabled = settings.get("ENABLED", False)
+    category_ids = config.settings_manager.id_set("CATEGORY_IDS")
+    blacklist_channel_ids = config.settings_manager.id_set("BLACKLIST_CHANNEL_IDS")
+    whitelist_role_ids = settings.get("WHITELIST_ROLE_IDS", [])
+    stores = settings.get("STORES", {})
     
     # Skip if link reaction is disabled
     if not enabled:
@@ -39,10 +41,7 @@ async def process_message(message):
     
     # Log the configuration being used
     logger.debug(f"Link reaction processing message with config - enabled: {enabled}, category IDs: {category_ids}")
-    if isinstance(stores, dict):
-        logger.debug(f"Stores configured: {list(stores.keys()) if stores else 'None'}")
-    else:
-        logger.debug(f"Stores configured (legacy format): {len(stores) if stores else 'None'}")
+    logger.debug(f"Stores configured: {list(stores.keys()) if stores else 'None'}")
     
     # Skip bot messages (except for webhooks and application messages)
     if message.author.bot and not (message.webhook_id or message.application_id):
@@ -68,21 +67,11 @@ async def process_message(message):
     # Check if channel ID matches any store's monitored channels
     channel_matches_store = False
     
-    # Handle stores whether it's a list or a dictionary
-    if isinstance(stores, dict):
-        # Dictionary format (new)
-        for store_id, store in stores.items():
-            if store.get('enabled', False) and message.channel.id in store.get('channel_ids', []):
-                channel_matches_store = True
-                logger.debug(f"Channel {message.channel.name} is in the monitored channels for store {store.get('name', store_id)}")
-                break
-    elif isinstance(stores, list):
-        # List format (legacy)
-        for store in stores:
-            if isinstance(store, dict) and store.get('enabled', False) and message.channel.id in store.get('channel_ids', []):
-                channel_matches_store = True
-                logger.debug(f"Channel {message.channel.name} is in the monitored channels for store {store.get('name', 'Unknown')}")
-                break
+    for store_id, store in config.STORES_BY_CHANNEL.get(message.channel.id, ()):
+        if store.get('enabled', False):
+            channel_matches_store = True
+            logger.debug(f"Channel {message.channel.name} is in the monitored channels for store {store.get('name', store_id)}")
+            break
     
     # Also check if the message's category is in our whitelist
     category_match = False
@@ -100,7 +89,7 @@ async def process_message(message):
         author_role_ids = {role.id for role in message.author.roles}
         
         # Check if any of the author's roles is in the whitelist
-        has_whitelisted_role = any(role_id in author_role_ids for role_id in whitelist_role_ids)
+        has_whitelisted_role = not author_role_ids.isdisjoint(whitelist_role_ids)
         
         if not has_whitelisted_role:
             logger.debug(f"User {message.author} doesn't have any whitelisted roles")
@@ -212,12 +201,10 @@ async def process_message(message):
     
     # Check if this message is also in a category that gets the forward reaction
     # If so, wait 3 seconds to make sure the forward reaction is added first
-    # Access CATEGORY_IDS as a property, not a function
-    forward_category_ids = forward_config.settings_manager.get("CATEGORY_IDS", [])
+    forward_category_ids = forward_config.settings_manager.id_set("CATEGORY_IDS")
     is_forward_category = hasattr(message.channel, 'category_id') and message.channel.category_id in forward_category_ids
     should_delay = False
     
-    # Also get ENABLED as a property
     forward_enabled = forward_config.settings_manager.get("ENABLED", False)
     
     if is_forward_category and forward_enabled:
@@ -232,7 +219,7 @@ async def process_message(message):
             await asyncio.sleep(3)
             
         # Add the link emoji reaction
-        link_emoji = config.settings_manager.get("LINK_EMOJI", "🔗")
+        link_emoji = settings.get("LINK_EMOJI", "🔗")
         await message.add_reaction(link_emoji)
         if message.webhook_id:
             logger.info(f"Added link reaction to webhook message in {message.channel.name}")
@@ -253,10 +240,11 @@ async def handle_reaction_add(reaction, user):
         reaction: The reaction that was added
         user: The user who added the reaction
     """
-    # Get configuration directly from settings manager
-    enabled = config.settings_manager.get("ENABLED", False)
-    link_emoji = config.settings_manager.get("LINK_EMOJI", "🔗")
-    whitelist_role_ids = config.settings_manager.get("WHITELIST_ROLE_IDS", [])
+    # Read all settings from a single snapshot
+    settings = config.settings_manager.snapshot()
+    enabled = settings.get("ENABLED", False)
+    link_emoji = settings.get("LINK_EMOJI", "🔗")
+    whitelist_role_ids = settings.get("WHITELIST_ROLE_IDS", [])
     
     # Skip if feature is disabled
     if not enabled:
@@ -283,7 +271,7 @@ async def handle_reaction_add(reaction, user):
         return
     
     # Log detailed information about the message that was reacted to
-    logger.info(f"User {user} reacted with link emoji to a message with embeds from {message.author} in {message.channel.name}")
+    logger.info("User %s reacted with link emoji to a message with embeds from %s in %s", user, message.author, message.channel.name)
     
     # Check if the user has a whitelisted role
     if whitelist_role_ids:
@@ -291,16 +279,13 @@ async def handle_reaction_add(reaction, user):
         user_role_ids = {role.id for role in user.roles}
         
         # Check if any of the user's roles is in the whitelist
-        has_whitelisted_role = any(role_id in user_role_ids for role_id in whitelist_role_ids)
+        has_whitelisted_role = not user_role_ids.isdisjoint(whitelist_role_ids)
         
         if not has_whitelisted_role:
-            logger.debug(f"User {user} doesn't have any whitelisted roles to process link reactions")
+            logger.debug("User %s doesn't have any whitelisted roles to process link reactions", user)
             return
         
-        logger.info(f"User {user} has whitelisted role, processing link reaction")
-    
-    # Get stores from the config
-    stores = config.settings_manager.get("STORES", {})
+        logger.info("User %s has whitelisted role, processing link reaction", user)
     
     # Log all embeds in the message
     logger.info(f"Message has {len(message.embeds)} embeds")
@@ -328,51 +313,21 @@ async def handle_reaction_add(reaction, user):
         logger.info(f"Full embed data: {embed_dict}")
         logger.info(f"--- EMBED #{i+1} END ---")
     
-    # Check each store's configuration
+    # Check the stores that monitor this channel
     processed = False
     
-    # Handle stores whether it's a list or a dictionary
-    if isinstance(stores, dict):
-        # Dictionary format (new)
-        for store_id, store_config in stores.items():
-            # Skip if store is disabled
-            if not store_config.get('enabled', False):
-                continue
-            
-            store_name = store_config.get('name', store_id)
-            
-            # Check if channel is in store's specific channels list
-            channel_ids = store_config.get('channel_ids', [])
-            if channel_ids and message.channel.id in channel_ids:
-                logger.info(f"Message channel {message.channel.id} is in {store_name}'s monitored channels")
-                processed = True
-                
-                # Extract PID information from the embed if it's a LuisaViaRoma embed
-                if store_name.lower() == "luisaviaroma" and message.embeds:
-                    await process_luisaviaroma_embed(message, user, store_config, embed)
-    elif isinstance(stores, list):
-        # List format (legacy)
-        for store_config in stores:
-            # Skip if not a dictionary
-            if not isinstance(store_config, dict):
-                continue
-                
-            # Skip if store is disabled
-            if not store_config.get('enabled', False):
-                continue
-            
-            store_name = store_config.get('name', 'Unknown')
-            
-            # Check if channel is in store's specific channels list
-            channel_ids = store_config.get('channel_ids', [])
-            if channel_ids and message.channel.id in channel_ids:
-                logger.info(f"Message channel {message.channel.id} is in {store_name}'s monitored channels")
-                processed = True
-                
-                # Extract PID information from the embed if it's a LuisaViaRoma embed
-                if store_name.lower() == "luisaviaroma" and message.embeds:
-                    for embed in message.embeds:
-                        await process_luisaviaroma_embed(message, user, store_config, embed)
+    for store_id, store_config in config.STORES_BY_CHANNEL.get(message.channel.id, ()):
+        # Skip if store is disabled
+        if not store_config.get('enabled', False):
+            continue
+        
+        store_name = store_config.get('name', store_id)
+        logger.info(f"Message channel {message.channel.id} is in {store_name}'s monitored channels")
+        processed = True
+        
+        # Extract PID information from the embed if it's a LuisaViaRoma embed
+        if store_name.lower() == "luisaviaroma" and message.embeds:
+            await process_luisaviaroma_embed(message, user, store_config, embed)
     
     if not processed:
         logger.info(f"Message not in any store's monitored channels")
@@ -398,9 +353,9 @@ async def process_luisaviaroma_embed(message, user, store_config, embed):
         if embed.url:
             logger.info(f"Trying URL extraction for LuisaViaRoma")
             # Extract from URL pattern
-            url_parts = embed.url.split('/')
-            if url_parts and len(url_parts) > 1:
-                potential_pid = url_parts[-1]
+            match = URL_PID_RE.search(embed.url)
+            if match:
+                potential_pid = match.group(1)
                 # Check if it matches LuisaViaRoma PID format (usually has hyphens)
                 if '-' in potential_pid:
                     pid_value = potential_pid
@@ -431,7 +386,7 @@ async def process_luisaviaroma_embed(message, user, store_config, embed):
                     # Create directory if it doesn\'t exist
 
                     
-                    os.makedirs(os.path.dirname(os.path.abspath(store_file_path)), exist_ok=True)
+                    ensure_store_dir(store_file_path)
 
                     
                     
@@ -510,59 +465,40 @@ def setup_link_reaction(bot):
     """
     logger.info("Setting up link_reaction feature")
     
-    # Get configuration directly from settings manager
-    enabled = config.settings_manager.get("ENABLED", False)
-    category_ids = config.settings_manager.get("CATEGORY_IDS", [])
-    blacklist_channel_ids = config.settings_manager.get("BLACKLIST_CHANNEL_IDS", [])
-    stores = config.settings_manager.get("STORES", {})
+    # Read all settings from a single snapshot
+    settings = config.settings_manager.snapshot()
+    enabled = settings.get("ENABLED", False)
+    category_ids = settings.get("CATEGORY_IDS", [])
+    blacklist_channel_ids = settings.get("BLACKLIST_CHANNEL_IDS", [])
+    stores = settings.get("STORES", {})
     
     logger.info(f"Link reaction enabled: {enabled}")
     logger.info(f"Whitelisted categories: {category_ids}")
     logger.info(f"Blacklisted channels: {blacklist_channel_ids}")
     
     # Register commands
-    from .commands import setup_commands
     setup_commands(bot)
     logger.info("Registered link reaction commands")
     
     # Log the stores configuration
     all_monitored_channels = set()
     
-    # Handle stores whether it's a list or a dictionary
-    logger.info(f"Stores data type: {type(stores).__name__}")
-    
-    if isinstance(stores, dict):
-        # Dictionary format (new)
-        for store_id, store in stores.items():
-            if store.get('enabled', False):
-                store_name = store.get('name', store_id)
-                file_path = store.get('file_path', 'Not configured')
-                channel_ids = store.get('channel_ids', [])
-                all_monitored_channels.update(channel_ids)
-                
-                # Log the detection method
-                detection = store.get('detection', {})
-                detection_type = detection.get('type', 'None')
-                detection_value = detection.get('value', 'None')
-                
-                logger.info(f"Store configured: {store_name}")
-                logger.info(f"  - File path: {file_path}")
-                logger.info(f"  - Channel IDs: {channel_ids}")
-                logger.info(f"  - Detection: {detection_type}:{detection_value}")
-    elif isinstance(stores, list):
-        # List format (legacy)
-        for store in stores:
-            if isinstance(store, dict) and store.get('enabled', False):
-                store_name = store.get('name', 'Unknown')
-                file_path = store.get('file_path', 'Not configured')
-                channel_ids = store.get('channel_ids', [])
-                all_monitored_channels.update(channel_ids)
-                
-                logger.info(f"Store configured (legacy format): {store_name}")
-                logger.info(f"  - File path: {file_path}")
-                logger.info(f"  - Channel IDs: {channel_ids}")
-    else:
-        logger.warning(f"Unknown stores data type: {type(stores).__name__}")
+    for store_id, store in stores.items():
+        if store.get('enabled', False):
+            store_name = store.get('name', store_id)
+            file_path = store.get('file_path', 'Not configured')
+            channel_ids = store.get('channel_ids', [])
+            all_monitored_channels.update(channel_ids)
+            
+            # Log the detection method
+            detection = store.get('detection', {})
+            detection_type = detection.get('type', 'None')
+            detection_value = detection.get('value', 'None')
+            
+            logger.info(f"Store configured: {store_name}")
+            logger.info(f"  - File path: {file_path}")
+            logger.info(f"  - Channel IDs: {channel_ids}")
+            logger.info(f"  - Detection: {detection_type}:{detection_value}")
     
     logger.info(f"Total unique monitored channels: {len(all_monitored_channels)}")
     
@@ -5,9 +5,11 @@ This module provides functionality for removing PIDs from the LuisaViaRoma track
 """
 
 import os
+import asyncio
 import logging
 import discord
 from config.features.reactions import link as link_reaction_config
+from utils.permissions import has_module_permission
 
 logger = logging.getLogger('discord_bot.modules.mod.link_reaction.remover')
 
@@ -24,20 +26,7 @@ async def remove_pid_from_file(pid, channel=None):
         str: Message describing the result
     """
     # Get LuisaViaRoma store configuration
-    stores = link_reaction_config.settings_manager.get("STORES", {})
-    
-    # Check if we're using the new dictionary format or legacy list format
-    store_config = None
-    
-    if isinstance(stores, dict):
-        # Dictionary format (new)
-        store_config = stores.get("luisaviaroma", {})
-    elif isinstance(stores, list):
-        # List format (legacy)
-        for store in stores:
-            if isinstance(store, dict) and store.get('name', '').lower() == "luisaviaroma":
-                store_config = store
-                break
+    store_config = link_reaction_config.get_store("luisaviaroma")
     
     if not store_config:
         message = "❌ LuisaViaRoma store not configured."
@@ -56,12 +45,28 @@ async def remove_pid_from_file(pid, channel=None):
             await channel.send(message)
         return False, message
     
+    # File I/O runs in a worker thread so a slow disk doesn't stall the event loop
+    removed, message = await asyncio.to_thread(_remove_pid, file_path, pid)
+    if channel:
+        await channel.send(message)
+    return removed, message
+
+def _remove_pid(file_path, pid):
+    """
+    Rewrite the tracking file without the given PID
+    
+    Args:
+        file_path: Path to the LuisaViaRoma tracking file
+        pid: The product ID to remove
+    
+    Returns:
+        bool: True if the PID was removed, False otherwise
+        str: Message describing the result
+    """
     # Check if file exists
     if not os.path.exists(file_path):
         message = f"❌ File not found: {file_path}"
         logger.error(message)
-        if channel:
-            await channel.send(message)
         return False, message
     
     # Read file content
@@ -71,8 +76,6 @@ async def remove_pid_from_file(pid, channel=None):
     except Exception as e:
         message = f"❌ Error reading file: {str(e)}"
         logger.error(message)
-        if channel:
-            await channel.send(message)
         return False, message
     
     # Look for PID in the file
@@ -92,8 +95,6 @@ async def remove_pid_from_file(pid, channel=None):
     if not pid_found:
         message = f"ℹ️ Product ID `{pid}` not found in the LuisaViaRoma tracking list."
         logger.info(message)
-        if channel:
-            await channel.send(message)
         return False, message
     
     # Write modified content back to file
@@ -108,31 +109,21 @@ async def remove_pid_from_file(pid, channel=None):
         
         message = f"✅ Removed product ID `{pid}` from LuisaViaRoma tracking list."
         logger.info(message)
-        if channel:
-            await channel.send(message)
         return True, message
     except Exception as e:
         message = f"❌ Error writing to file: {str(e)}"
         logger.error(message)
-        if channel:
-            await channel.send(message)
         return False, message
 
 def setup_remover_commands(bot):
     """Register user context menu command for removing PIDs"""
     logger.info("Setting up LuisaViaRoma remover user commands")
     
-    # Import required libraries
-    import discord.app_commands as app_commands
-    from discord import app_commands
-    from typing import Optional
-    from utils.permissions import check_permissions
-    
     # Create a "Remove PID" context menu command that works on users
     @bot.tree.context_menu(name="Remove PID")
     async def remove_pid_context_menu(interaction: discord.Interaction, user: discord.User):
         # Check if the user has permission to use this command
-        if not await check_permissions(interaction.user, 'mod'):
+        if not has_module_permission(interaction.user, 'mod'):
             await interaction.response.send_message("⚠️ You don't have permission to use this command.", ephemeral=True)
             return
         
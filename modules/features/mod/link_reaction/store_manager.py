@@ -8,10 +8,44 @@ Uses the rule engine to store and retrieve store configurations.
 import os
 import logging
 import re
+from functools import lru_cache
+from types import MappingProxyType
 from core.rules_engine import RuleManager
 
 logger = logging.getLogger('discord_bot.modules.mod.link_reaction.store_manager')
 
+# Default product URL pattern; the last path segment is the product ID
+URL_PID_PATTERN = r'\/[^\/]+\/([^\/]+)$'
+URL_PID_RE = re.compile(URL_PID_PATTERN)
+
+# Built-in stores: store ID -> add_store() arguments
+DEFAULT_STORES = MappingProxyType({
+    "luisaviaroma": MappingProxyType({
+        "name": "LUISAVIAROMA",
+        "file_path": os.getenv("luisaviaroma_drops_urls_path", "data/luisaviaroma_drop_urls.txt"),
+        "detection_type": "author_name",
+        "detection_value": "LUISAVIAROMA",
+        "extraction_primary": "url",
+        "extraction_pattern": URL_PID_PATTERN
+    })
+})
+
+@lru_cache(maxsize=32)
+def _store_dir(file_path):
+    """Resolve the directory of a store's PID file; paths only change with the store configuration."""
+    return os.path.dirname(os.path.abspath(file_path))
+
+def ensure_store_dir(file_path):
+    """
+    Create the directory for a store's PID file.
+    
+    The path is resolved once per store file, but the directory is checked
+    on every call so it is recreated if it was removed while the bot runs.
+    """
+    directory = _store_dir(file_path)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
 class StoreManager:
     """Manages store configurations for link reaction feature."""
     
@@ -24,30 +58,18 @@ class StoreManager:
     
     def _initialize_default_stores(self):
         """Set up default store configurations."""
-        
-        # Add LUISAVIAROMA as default store
-        self.rule_manager.add_rule("luisaviaroma", {
-            "enabled": True,
-            "name": "LUISAVIAROMA",
-            "description": "Extract product IDs from LUISAVIAROMA embeds",
-            "file_path": os.getenv("luisaviaroma_drops_urls_path", "data/luisaviaroma_drop_urls.txt"),
-            "detection": {
-                "type": "author_name",
-                "value": "LUISAVIAROMA"
-            },
-            "extraction": {
-                "primary": "url",
-                "pattern": r'\/[^\/]+\/([^\/]+)$',
-                "fallback": "field_pid"
-            }
-        })
-        
-        logger.info("Initialized default store configuration for LUISAVIAROMA")
+        for store_id, store in DEFAULT_STORES.items():
+            self.add_store(store_id, **store)
+            logger.info(f"Initialized default store configuration for {store['name']}")
     
     def get_store(self, store_id):
         """Get store configuration by ID."""
         return self.rule_manager.get_rule(store_id)
     
+    def resolve_store_id(self, key):
+        """Resolve a store ID from an ID or store name, case-insensitively."""
+        return self.rule_manager.find_rule_id(key)
+    
     def get_all_stores(self):
         """Get all store configurations."""
         return self.rule_manager.get_all_rules()
@@ -57,7 +79,7 @@ class StoreManager:
         return self.rule_manager.get_active_rules()
     
     def add_store(self, store_id, name, file_path, detection_type, detection_value, 
-                  extraction_primary, extraction_pattern=None, description=None, enabled=True):
+                  extraction_primary, extraction_pattern=None, description=None, enabled=True, save=True):
         """Add a new store configuration."""
         return self.rule_manager.add_rule(store_id, {
             "enabled": enabled,
@@ -73,15 +95,19 @@ class StoreManager:
                 "pattern": extraction_pattern,
                 "fallback": "field_pid"  # Default fallback
             }
-        })
+        }, save=save)
     
-    def remove_store(self, store_id):
+    def remove_store(self, store_id, save=True):
         """Remove a store configuration."""
-        return self.rule_manager.remove_rule(store_id)
+        return self.rule_manager.remove_rule(store_id, save=save)
     
-    def update_store(self, store_id, **updates):
+    def update_store(self, store_id, save=True, **updates):
         """Update a store configuration."""
-        return self.rule_manager.update_rule(store_id, **updates)
+        return self.rule_manager.update_rule(store_id, save=save, **updates)
+    
+    async def save_async(self):
+        """Save store configurations without blocking the event loop."""
+        return await self.rule_manager.save_rules_async()
 
 # Create a global instance of the store manager
 store_manager = StoreManager() 
\ No newline at end of file
@@ -5,46 +5,46 @@ This module provides a slash command to configure module-wide settings.
 """
 
 import logging
-import os
 import discord
 from discord import app_commands
-from discord.ext import commands
 from config.features.moderation import mod
 from config.features.embed_config import embed as embed_config
 from utils.permissions import mod_only
+from modules.features.mod.config_cmd_factory import update_env_values
 
 logger = logging.getLogger('discord_bot.modules.mod.mod_config_cmd')
 
-async def update_env_file(key, value):
+async def parse_role_id(interaction, value):
     """
-    Update a value in the .env file.
+    Parse a role ID from a role mention or a numeric ID.
     
     Args:
-        key: The key to update
-        value: The new value
-    """
-    env_path = '.env'
-    
-    # Read the current .env file
-    with open(env_path, 'r') as file:
-        lines = file.readlines()
+        interaction: The Discord interaction, used to report invalid input
+        value: The role mention or ID
     
-    # Find and update the specified key
-    key_found = False
-    for i, line in enumerate(lines):
-        if line.strip() and not line.strip().startswith('#'):
-            if line.split('=')[0].strip() == key:
-                lines[i] = f"{key}={value}\n"
-                key_found = True
-                break
-    
-    # If key wasn't found, add it
-    if not key_found:
-        lines.append(f"{key}={value}\n")
+    Returns:
+        int: The role ID, or None if the input was invalid
+    """
+    if value.startswith('<@&') and value.endswith('>'):
+        # Extract ID from mention
+        try:
+            return int(value[3:-1])
+        except ValueError:
+            await interaction.response.send_message(
+                f"Invalid role mention: {value}",
+                ephemeral=True
+            )
+            return None
     
-    # Write the updated content back to the .env file
-    with open(env_path, 'w') as file:
-        file.writelines(lines)
+    # Try direct ID
+    try:
+        return int(value)
+    except ValueError:
+        await interaction.response.send_message(
+            f"Invalid role ID: {value}. Please use a role mention or numeric ID.",
+            ephemeral=True
+        )
+        return None
 
 async def handle_mod_config(interaction, setting=None, action=None, value=None):
     """
@@ -67,10 +67,9 @@ async def handle_mod_config(interaction, setting=None, action=None, value=None):
     # If no setting specified, show current configuration
     if not setting:
         # Create an embed with the current configuration
-        embed = discord.Embed(
+        embed = embed_config.create_embed(
             title="Mod Module Configuration",
-            description="Current module-wide settings",
-            color=discord.Color.blue()
+            description="Current module-wide settings"
         )
         
         # Format the whitelist role IDs
@@ -95,9 +94,6 @@ async def handle_mod_config(interaction, setting=None, action=None, value=None):
             inline=False
         )
         
-        # Apply default styling
-        embed = embed_config.apply_default_styling(embed)
-        
         await interaction.response.send_message(embed=embed)
         return
     
@@ -133,28 +129,9 @@ async def handle_mod_config(interaction, setting=None, action=None, value=None):
                 return
             
             # Extract role ID from mention or direct ID
-            role_id = None
-            if value.startswith('<@&') and value.endswith('>'):
-                # Extract ID from mention
-                role_id_str = value[3:-1]
-                try:
-                    role_id = int(role_id_str)
-                except ValueError:
-                    await interaction.response.send_message(
-                        f"Invalid role mention: {value}",
-                        ephemeral=True
-                    )
-                    return
-            else:
-                # Try direct ID
-                try:
-                    role_id = int(value)
-                except ValueError:
-                    await interaction.response.send_message(
-                        f"Invalid role ID: {value}. Please use a role mention or numeric ID.",
-                        ephemeral=True
-                    )
-                    return
+            role_id = await parse_role_id(interaction, value)
+            if role_id is None:
+                return
             
             # Verify role exists
             role = interaction.guild.get_role(role_id)
@@ -177,13 +154,18 @@ async def handle_mod_config(interaction, setting=None, action=None, value=None):
             current_whitelist.append(role_id)
             whitelist_str = ",".join(str(id) for id in current_whitelist)
             
-            # Update the .env file
-            await update_env_file('MOD_WHITELIST_ROLE_IDS', whitelist_str)
+            await interaction.response.defer(ephemeral=True)
+            if not await update_env_values({'MOD_WHITELIST_ROLE_IDS': whitelist_str}):
+                await interaction.followup.send(
+                    "Failed to update the module whitelist. Check the logs for more information.",
+                    ephemeral=True
+                )
+                return
             
             # Update the in-memory config
             mod.WHITELIST_ROLE_IDS = current_whitelist
             
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"Added role {role.name} to the module whitelist.",
                 ephemeral=True
             )
@@ -197,33 +179,17 @@ async def handle_mod_config(interaction, setting=None, action=None, value=None):
                 return
             
             # Extract role ID from mention or direct ID
-            role_id = None
-            if value.startswith('<@&') and value.endswith('>'):
-                # Extract ID from mention
-                role_id_str = value[3:-1]
-                try:
-                    role_id = int(role_id_str)
-                except ValueError:
-                    await interaction.response.send_message(
-                        f"Invalid role mention: {value}",
-                        ephemeral=True
-                    )
-                    return
-            else:
-                # Try direct ID
-                try:
-                    role_id = int(value)
-                except ValueError:
-                    await interaction.response.send_message(
-                        f"Invalid role ID: {value}. Please use a role mention or numeric ID.",
-                        ephemeral=True
-                    )
-                    return
+            role_id = await parse_role_id(interaction, value)
+            if role_id is None:
+                return
+            
+            # Resolve the role once for both responses
+            role = interaction.guild.get_role(role_id)
+            role_name = role.name if role else f"ID {role_id}"
             
             # Update the whitelist
             current_whitelist = list(mod.WHITELIST_ROLE_IDS)
             if role_id not in current_whitelist:
-                role_name = interaction.guild.get_role(role_id).name if interaction.guild.get_role(role_id) else f"ID {role_id}"
                 await interaction.response.send_message(
                     f"Role {role_name} is not in the whitelist.",
                     ephemeral=True
@@ -233,26 +199,36 @@ async def handle_mod_config(interaction, setting=None, action=None, value=None):
             current_whitelist.remove(role_id)
             whitelist_str = ",".join(str(id) for id in current_whitelist)
             
-            # Update the .env file
-            await update_env_file('MOD_WHITELIST_ROLE_IDS', whitelist_str)
+            await interaction.response.defer(ephemeral=True)
+            if not await update_env_values({'MOD_WHITELIST_ROLE_IDS': whitelist_str}):
+                await interaction.followup.send(
+                    "Failed to update the module whitelist. Check the logs for more information.",
+                    ephemeral=True
+                )
+                return
             
             # Update the in-memory config
             mod.WHITELIST_ROLE_IDS = current_whitelist
             
-            role_name = interaction.guild.get_role(role_id).name if interaction.guild.get_role(role_id) else f"ID {role_id}"
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"Removed role {role_name} from the module whitelist.",
                 ephemeral=True
             )
         
         elif action.lower() == "clear":
             # Clear the whitelist
-            await update_env_file('MOD_WHITELIST_ROLE_IDS', '')
+            await interaction.response.defer(ephemeral=True)
+            if not await update_env_values({'MOD_WHITELIST_ROLE_IDS': ''}):
+                await interaction.followup.send(
+                    "Failed to update the module whitelist. Check the logs for more information.",
+                    ephemeral=True
+                )
+                return
             
             # Update the in-memory config
             mod.WHITELIST_ROLE_IDS = []
             
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "Cleared the module whitelist. All roles have been removed.",
                 ephemeral=True
             )
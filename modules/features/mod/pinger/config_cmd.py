@@ -6,18 +6,22 @@ This module provides a command to configure the pinger feature.
 
 import logging
 import discord
-import os
-import re
-from pathlib import Path
-from discord import app_commands
-from config.features.pinger_config import pinger
+from config.features.pinger_config import pinger_config
 from config.features.embed_config import embed as embed_config
+from modules.features.mod.config_cmd_factory import make_config_command, update_env_values
 
 logger = logging.getLogger('discord_bot.modules.mod.pinger.config_cmd')
 
+# Mention monitoring settings: setting -> (env key, config attribute, display name)
+MONITOR_SETTINGS = {
+    "everyone": ("PINGER_MONITOR_EVERYONE", "MONITOR_EVERYONE", "@everyone"),
+    "here": ("PINGER_MONITOR_HERE", "MONITOR_HERE", "@here"),
+    "roles": ("PINGER_MONITOR_ROLES", "MONITOR_ROLES", "role mentions")
+}
+
 async def update_env_value(key, value):
     """
-    Update a value in the .env file.
+    Update a value in the .env file without blocking the event loop.
     
     Args:
         key: The environment variable key
@@ -26,41 +30,55 @@ async def update_env_value(key, value):
     Returns:
         bool: True if successful, False otherwise
     """
-    try:
-        # Find the .env file
-        env_path = Path('.env')
-        if not env_path.exists():
-            logger.error(".env file not found")
-            return False
-        
-        # Read the .env file
-        with open(env_path, 'r') as file:
-            lines = file.readlines()
-        
-        # Find and update the specified key
-        pattern = re.compile(f'^{key}=.*$')
-        updated = False
-        
-        for i, line in enumerate(lines):
-            if pattern.match(line):
-                lines[i] = f"{key}={value}\n"
-                updated = True
-                break
-        
-        # If the key doesn't exist, add it to the end
-        if not updated:
-            lines.append(f"{key}={value}\n")
-        
-        # Write the updated content back to the .env file
-        with open(env_path, 'w') as file:
-            file.writelines(lines)
-        
-        logger.info(f"Updated {key} in .env file to {value}")
-        return True
+    return await update_env_values({key: value})
+
+async def update_config(key, value):
+    """
+    Update a pinger config value and queue a coalesced save.
     
-    except Exception as e:
-        logger.error(f"Error updating .env file: {str(e)}")
-        return False
+    Args:
+        key: The config key to update
+        value: The new value
+    """
+    pinger_config.set(key, value, save=False)
+    pinger_config.schedule_save()
+
+def whitelist_role_mentions(guild):
+    """
+    Get mentions for the whitelisted roles that still exist in a guild.
+    
+    Args:
+        guild: The Discord guild
+    
+    Returns:
+        list: Role mentions
+    """
+    roles = (guild.get_role(role_id) for role_id in pinger_config.WHITELIST_ROLE_IDS)
+    return [role.mention for role in roles if role]
+
+def build_view_template(embed):
+    """
+    Add the static content of the configuration view to an embed.
+    
+    Args:
+        embed: The styled embed to fill in
+    """
+    embed.title = "Pinger Configuration"
+    embed.description = "Current configuration settings for the pinger feature"
+    embed.add_field(
+        name="Command Usage",
+        value=(
+            "**Available settings:**\n"
+            "• `/pinger-config channel #channel-name` - Set notification channel\n"
+            "• `/pinger-config whitelist add @role` - Add role to whitelist\n"
+            "• `/pinger-config whitelist remove @role` - Remove role from whitelist\n"
+            "• `/pinger-config whitelist clear` - Clear entire whitelist\n"
+            "• `/pinger-config everyone true|false` - Enable/disable @everyone monitoring\n"
+            "• `/pinger-config here true|false` - Enable/disable @here monitoring\n"
+            "• `/pinger-config roles true|false` - Enable/disable role mention monitoring"
+        ),
+        inline=False
+    )
 
 async def config_command(interaction, setting=None, value=None):
     """
@@ -80,68 +98,28 @@ async def config_command(interaction, setting=None, value=None):
         # Make initial configuration display ephemeral
         await interaction.response.defer(ephemeral=True)
         
-        # Show all settings
-        embed = discord.Embed(
-            title="Pinger Configuration",
-            description="Current configuration settings for the pinger feature",
-            color=discord.Color.blue()
-        )
-        
-        # Add settings to the embed
-        embed.add_field(
-            name="Notification Channel",
-            value=f"<#{pinger.NOTIFICATION_CHANNEL_ID}>" if pinger.NOTIFICATION_CHANNEL_ID else "Not set",
-            inline=False
-        )
-        
-        whitelist_roles = []
-        for role_id in pinger_config.WHITELIST_ROLE_IDS:
-            role = interaction.guild.get_role(role_id)
-            if role:
-                whitelist_roles.append(role.mention)
-        
-        embed.add_field(
-            name="Whitelist Roles",
-            value=", ".join(whitelist_roles) if whitelist_roles else "None",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Monitor @everyone",
-            value="Enabled" if pinger_config.MONITOR_EVERYONE else "Disabled",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="Monitor @here",
-            value="Enabled" if pinger_config.MONITOR_HERE else "Disabled",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="Monitor role mentions",
-            value="Enabled" if pinger_config.MONITOR_ROLES else "Disabled",
-            inline=True
-        )
-        
-        # Add usage help to the embed
-        embed.add_field(
-            name="Command Usage",
-            value=(
-                "**Available settings:**\n"
-                "• `/pinger-config channel #channel-name` - Set notification channel\n"
-                "• `/pinger-config whitelist add @role` - Add role to whitelist\n"
-                "• `/pinger-config whitelist remove @role` - Remove role from whitelist\n"
-                "• `/pinger-config whitelist clear` - Clear entire whitelist\n"
-                "• `/pinger-config everyone true|false` - Enable/disable @everyone monitoring\n"
-                "• `/pinger-config here true|false` - Enable/disable @here monitoring\n"
-                "• `/pinger-config roles true|false` - Enable/disable role mention monitoring"
-            ),
-            inline=False
-        )
-        
-        # Apply default styling
-        embed = embed_config.apply_default_styling(embed)
+        # Show all settings ahead of the usage help that comes with the template
+        whitelist_roles = whitelist_role_mentions(interaction.guild)
+        embed = embed_config.create_from_template("pinger_config_view", build_view_template, fields=[
+            {
+                "name": "Notification Channel",
+                "value": f"<#{pinger_config.NOTIFICATION_CHANNEL_ID}>" if pinger_config.NOTIFICATION_CHANNEL_ID else "Not set",
+                "inline": False
+            },
+            {
+                "name": "Whitelist Roles",
+                "value": ", ".join(whitelist_roles) if whitelist_roles else "None",
+                "inline": False
+            },
+            {
+                "name": "Monitored Mentions",
+                "value": "\n".join(
+                    f"{'✅' if getattr(pinger_config, config_var) else '❌'} {setting_name}"
+                    for _, config_var, setting_name in MONITOR_SETTINGS.values()
+                ),
+                "inline": False
+            }
+        ])
         
         await interaction.followup.send(embed=embed)
         return
@@ -187,13 +165,18 @@ async def config_command(interaction, setting=None, value=None):
                 await interaction.response.send_message("Channel not found. Please provide a valid channel ID or mention.", ephemeral=True)
                 return
             
+            # Skip the .env and config writes if the channel is already set
+            if pinger_config.NOTIFICATION_CHANNEL_ID == int(channel_id):
+                await interaction.response.send_message(f"Notification channel is already set to {channel.mention}.", ephemeral=True)
+                return
+            
             # Update the .env file
             await interaction.response.defer(ephemeral=True)
             success = await update_env_value('PINGER_NOTIFICATION_CHANNEL_ID', channel_id)
             
             if success:
                 # Update the variable in memory
-                pinger_config.NOTIFICATION_CHANNEL_ID = int(channel_id)
+                await update_config("NOTIFICATION_CHANNEL_ID", int(channel_id))
                 await interaction.followup.send(f"Notification channel updated to {channel.mention}. The changes will take effect immediately, but will also persist after restart.")
             else:
                 await interaction.followup.send("Failed to update the notification channel. Check the logs for more information.")
@@ -202,11 +185,7 @@ async def config_command(interaction, setting=None, value=None):
         if not value:
             # Show current whitelist with guidance
             await interaction.response.defer(ephemeral=True)
-            whitelist_roles = []
-            for role_id in pinger_config.WHITELIST_ROLE_IDS:
-                role = interaction.guild.get_role(role_id)
-                if role:
-                    whitelist_roles.append(role.mention)
+            whitelist_roles = whitelist_role_mentions(interaction.guild)
             
             usage_help = (
                 "\n\n**Available commands:**\n"
@@ -227,12 +206,16 @@ async def config_command(interaction, setting=None, value=None):
             command = parts[0].lower() if parts else ""
             
             if command == "clear":
+                if not pinger_config.WHITELIST_ROLE_IDS:
+                    await interaction.followup.send("The whitelist is already empty.")
+                    return
+                
                 # Clear the whitelist
                 success = await update_env_value('PINGER_WHITELIST_ROLE_IDS', "")
                 
                 if success:
                     # Update the variable in memory
-                    pinger_config.WHITELIST_ROLE_IDS = []
+                    await update_config("WHITELIST_ROLE_IDS", [])
                     await interaction.followup.send("Whitelist has been cleared. The changes will take effect immediately, but will also persist after restart.")
                 else:
                     await interaction.followup.send("Failed to clear the whitelist. Check the logs for more information.")
@@ -283,7 +266,7 @@ async def config_command(interaction, setting=None, value=None):
                     
                     if success:
                         # Update the variable in memory
-                        pinger_config.WHITELIST_ROLE_IDS = current_whitelist
+                        await update_config("WHITELIST_ROLE_IDS", current_whitelist)
                         await interaction.followup.send(f"Added {role.mention} to the whitelist. The changes will take effect immediately, but will also persist after restart.")
                     else:
                         await interaction.followup.send("Failed to update the whitelist. Check the logs for more information.")
@@ -301,7 +284,7 @@ async def config_command(interaction, setting=None, value=None):
                     
                     if success:
                         # Update the variable in memory
-                        pinger_config.WHITELIST_ROLE_IDS = current_whitelist
+                        await update_config("WHITELIST_ROLE_IDS", current_whitelist)
                         await interaction.followup.send(f"Removed {role.mention} from the whitelist. The changes will take effect immediately, but will also persist after restart.")
                     else:
                         await interaction.followup.send("Failed to update the whitelist. Check the logs for more information.")
@@ -317,19 +300,13 @@ async def config_command(interaction, setting=None, value=None):
                     ephemeral=True
                 )
     
-    elif setting.lower() in ["everyone", "here", "roles"]:
+    elif setting.lower() in MONITOR_SETTINGS:
+        env_key, config_var, setting_name = MONITOR_SETTINGS[setting.lower()]
+        
         if not value:
             # Show current setting with guidance
             await interaction.response.defer(ephemeral=True)
-            if setting.lower() == "everyone":
-                enabled = pinger_config.MONITOR_EVERYONE
-                setting_name = "@everyone"
-            elif setting.lower() == "here":
-                enabled = pinger_config.MONITOR_HERE
-                setting_name = "@here"
-            else:  # roles
-                enabled = pinger_config.MONITOR_ROLES
-                setting_name = "role mentions"
+            enabled = getattr(pinger_config, config_var)
                 
             await interaction.followup.send(
                 f"Monitoring for {setting_name} is currently **{'enabled' if enabled else 'disabled'}**.\n\n"
@@ -345,19 +322,14 @@ async def config_command(interaction, setting=None, value=None):
                 )
                 return
             
-            # Get the corresponding env var name
-            if setting.lower() == "everyone":
-                env_key = "PINGER_MONITOR_EVERYONE"
-                config_var = "MONITOR_EVERYONE"
-                setting_name = "@everyone"
-            elif setting.lower() == "here":
-                env_key = "PINGER_MONITOR_HERE"
-                config_var = "MONITOR_HERE"
-                setting_name = "@here"
-            else:  # roles
-                env_key = "PINGER_MONITOR_ROLES"
-                config_var = "MONITOR_ROLES"
-                setting_name = "role mentions"
+            # Skip the .env and config writes if nothing changes
+            new_value = value.lower() == 'true'
+            if getattr(pinger_config, config_var) == new_value:
+                await interaction.response.send_message(
+                    f"Monitoring for {setting_name} is already **{'enabled' if new_value else 'disabled'}**.",
+                    ephemeral=True
+                )
+                return
             
             # Update the .env file
             await interaction.response.defer(ephemeral=True)
@@ -365,8 +337,7 @@ async def config_command(interaction, setting=None, value=None):
             
             if success:
                 # Update the variable in memory
-                new_value = value.lower() == 'true'
-                setattr(pinger_config, config_var, new_value)
+                await update_config(config_var, new_value)
                 await interaction.followup.send(f"Monitoring for {setting_name} has been **{'enabled' if new_value else 'disabled'}**. The changes will take effect immediately, but will also persist after restart.")
             else:
                 await interaction.followup.send(f"Failed to update monitoring setting for {setting_name}. Check the logs for more information.")
@@ -393,20 +364,12 @@ def setup_config_cmd(bot):
     """
     logger.info("Registering pinger-config command")
     
-    # Import the permission decorator
-    from utils.permissions import mod_only
-    
-    @bot.tree.command(
-        name="pinger-config",
-        description="Configure the mention notifications feature"
-    )
-    @app_commands.describe(
-        setting="The setting to view or modify (channel, everyone, here, roles, whitelist)",
-        action="The action to perform for whitelist (add, remove, clear, view)",
-        value="The value for the action"
-    )
-    @mod_only()
-    async def pinger_config(interaction: discord.Interaction, setting: str = None, action: str = None, value: str = None):
-        await handle_pinger_config(interaction, setting, action, value)
+    bot.tree.add_command(make_config_command(
+        "pinger-config",
+        "Configure the mention notifications feature",
+        config_command,
+        "The setting to view or modify (channel, everyone, here, roles, whitelist)",
+        "The value for the setting (for whitelist: add @role, remove @role, clear)"
+    ))
         
-    logger.info("Registered pinger-config command") 
\ No newline at end of file
+    logger.info("Registered pinger-config command")
@@ -43,12 +43,13 @@ async def process_message(message):
     except Exception as e:
         logger.debug(f"Error logging message info: {str(e)}")
     
-    # Get current configuration values directly from properties
-    notification_channel_id = pinger_config.NOTIFICATION_CHANNEL_ID
-    monitor_everyone = pinger_config.MONITOR_EVERYONE
-    monitor_here = pinger_config.MONITOR_HERE
-    monitor_roles = pinger_config.MONITOR_ROLES
-    whitelist_role_ids = pinger_config.WHITELIST_ROLE_IDS
+    # Read all settings from a single snapshot
+    settings = pinger_config.snapshot()
+    notification_channel_id = settings.get("NOTIFICATION_CHANNEL_ID")
+    monitor_everyone = settings.get("MONITOR_EVERYONE", True)
+    monitor_here = settings.get("MONITOR_HERE", True)
+    monitor_roles = settings.get("MONITOR_ROLES", True)
+    whitelist_role_ids = settings.get("WHITELIST_ROLE_IDS", [])
     
     # Skip if notification channel is not configured
     if not notification_channel_id:
@@ -250,9 +251,7 @@ def setup_pinger(bot):
             # Process the message for mentions
             await process_message(message)
         except Exception as e:
-            logger.error(f"Error in pinger on_message handler: {str(e)}")
-            import traceback
-            logger.error(f"Exception traceback: {traceback.format_exc()}")
+            logger.exception("Error in pinger on_message handler: %s", e)
         
         # Call the original handler if it exists
         try:
@@ -28,11 +28,12 @@ async def process_message(message):
     Args:
         message: The Discord message to process
     """
-    # Get settings directly from config properties
-    enabled = config.ENABLED
-    category_ids = config.CATEGORY_IDS
-    blacklist_channel_ids = config.BLACKLIST_CHANNEL_IDS
-    forward_emoji = config.FORWARD_EMOJI
+    # Read all settings from a single snapshot
+    settings = config.snapshot()
+    enabled = settings.get("ENABLED", False)
+    category_ids = config.id_set("CATEGORY_IDS")
+    blacklist_channel_ids = config.id_set("BLACKLIST_CHANNEL_IDS")
+    forward_emoji = settings.get("FORWARD_EMOJI", "📨")
     
     # Log detailed debug information on every message
     if hasattr(message.channel, 'name') and hasattr(message.channel, 'category_id'):
@@ -151,7 +152,7 @@ async def handle_reaction_add(reaction, user):
         return
     
     # Log detailed information about the message being forwarded
-    logger.info(f"Forward reaction added by {user} to message from {message.author} in {message.channel.name}")
+    logger.info("Forward reaction added by %s to message from %s in %s", user, message.author, message.channel.name)
     logger.info(f"Message content: {message.content[:100]}{'...' if len(message.content) > 100 else ''}")
     
     # Skip if feature is disabled
@@ -199,26 +200,21 @@ async def handle_reaction_add(reaction, user):
         # Convert user's roles to set of IDs for quick lookup
         user_role_ids = {role.id for role in user.roles}
         
-        # Make sure whitelist_role_ids are integers
-        whitelist_role_ids_int = []
-        for role_id in whitelist_role_ids:
-            try:
-                if isinstance(role_id, str) and role_id.isdigit():
-                    whitelist_role_ids_int.append(int(role_id))
-                elif isinstance(role_id, int):
-                    whitelist_role_ids_int.append(role_id)
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Invalid whitelist role ID: {role_id} - {e}")
+        # Make sure whitelist_role_ids are integers; invalid entries are skipped
+        whitelist_role_ids_int = {
+            int(role_id) for role_id in whitelist_role_ids
+            if isinstance(role_id, int) or (isinstance(role_id, str) and role_id.isdecimal())
+        }
         
         # Check if any of the user's roles is in the whitelist
-        has_whitelisted_role = any(role_id in user_role_ids for role_id in whitelist_role_ids_int)
+        has_whitelisted_role = not user_role_ids.isdisjoint(whitelist_role_ids_int)
         
         if not has_whitelisted_role:
             logger.warning(f"User {user} attempted to forward message but doesn't have any whitelisted roles. User roles: {user_role_ids}, Whitelist: {whitelist_role_ids_int}")
             try:
                 # Remove the reaction
                 await message.remove_reaction(reaction.emoji, user)
-                logger.info(f"Removed unauthorized forward reaction from {user}")
+                logger.info("Removed unauthorized forward reaction from %s", user)
             except Exception as e:
                 logger.error(f"Failed to remove unauthorized reaction: {e}")
             return
@@ -232,7 +228,7 @@ async def handle_reaction_add(reaction, user):
         return
     
     # At this point, user has permission to forward
-    logger.info(f"User {user} has whitelisted role, forwarding message")
+    logger.info("User %s has whitelisted role, forwarding message", user)
     
     # Get the notification channel from destination channel ID
     if not destination_channel_id:
@@ -247,8 +243,11 @@ async def handle_reaction_add(reaction, user):
     
     try:
         # Use Discord's official message forwarding feature
-        # Create the webhook to send the message
-        webhooks = await destination_channel.webhooks()
+        # Look up the webhooks while the attachments download; neither depends on the other
+        webhooks, files = await asyncio.gather(
+            destination_channel.webhooks(),
+            asyncio.gather(*(attachment.to_file() for attachment in message.attachments))
+        )
         webhook = None
         
         # Look for an existing webhook we can use
@@ -309,7 +308,7 @@ async def handle_reaction_add(reaction, user):
             avatar_url=message.author.display_avatar.url,
             wait=True,
             allowed_mentions=discord.AllowedMentions.none(),
-            files=[await a.to_file() for a in message.attachments] if message.attachments else [],
+            files=files,
             embeds=message.embeds if message.embeds else []
         )
         
@@ -327,7 +326,7 @@ async def handle_reaction_add(reaction, user):
             view=view
         )
         
-        logger.info(f"Message from {message.author} forwarded to {destination_channel.name} by {user}")
+        logger.info("Message from %s forwarded to %s by %s", message.author, destination_channel.name, user)
     except discord.errors.HTTPException as e:
         logger.error(f"Failed to forward message: {str(e)}")
         
@@ -452,8 +451,9 @@ def setup_reaction_forward(bot):
         except (ValueError, TypeError) as e:
             logger.warning(f"Invalid category ID in settings: {cat_id} - {e}")
     
-    # Store the processed category_ids back to config properties
-    config.CATEGORY_IDS = category_ids
+    # Store the processed category_ids back only if normalizing changed them
+    if category_ids != category_ids_raw:
+        config.CATEGORY_IDS = category_ids
             
     # Fall back to pinger notification channel if destination channel not set
     if not destination_channel_id:
@@ -19,14 +19,11 @@ async def handle_online_help(interaction):
     Args:
         interaction: The Discord interaction
     """
-    embed = discord.Embed(
+    embed = embed_config.create_embed(
         title="Online Module Help",
         description="The Online module provides functionality for online product monitoring and management."
     )
     
-    # Apply styling from embed_config
-    embed = embed_config.apply_default_styling(embed)
-    
     # Add placeholder information
     embed.add_field(
         name="🛍️ Online Monitoring",
@@ -19,14 +19,11 @@ async def handle_redeye_help(interaction):
     Args:
         interaction: The Discord interaction
     """
-    embed = discord.Embed(
+    embed = embed_config.create_embed(
         title="Redeye Module Help",
         description="The Redeye module provides functionality for viewing and managing profiles stored in CSV files."
     )
     
-    # Apply styling from embed_config
-    embed = embed_config.apply_default_styling(embed)
-    
     # Add general information
     embed.add_field(
         name="👤 Profile Management",
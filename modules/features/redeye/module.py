@@ -13,6 +13,14 @@ from config.features.redeye_config import redeye as redeye_config
 
 logger = logging.getLogger('discord_bot.modules.redeye')
 
+def _command_paths(cmds, prefix: str = "/"):
+    """Yield the full slash path of each command and its subcommands."""
+    for cmd in cmds:
+        path = f"{prefix}{cmd.name}"
+        yield path
+        if hasattr(cmd, 'commands'):
+            yield from _command_paths(cmd.commands, f"{path} ")
+
 async def setup(bot: commands.Bot, registered_commands: Optional[Set[str]] = None) -> Set[str]:
     """
     Set up the Redeye module.
@@ -31,25 +39,17 @@ async def setup(bot: commands.Bot, registered_commands: Optional[Set[str]] = Non
         if registered_commands is None:
             registered_commands = set()
         
+        existing_commands = bot.tree.get_commands()
+        
         # Log commands before clearing
-        logger.info("=== Commands Before Clearing ===")
-        for cmd in bot.tree.get_commands():
-            logger.info(f"Command: /{cmd.name}")
-            if hasattr(cmd, 'commands'):
-                for subcmd in cmd.commands:
-                    logger.info(f"  ├─ /{cmd.name} {subcmd.name}")
-                    if hasattr(subcmd, 'commands'):
-                        for nested_cmd in subcmd.commands:
-                            logger.info(f"  │  └─ /{cmd.name} {subcmd.name} {nested_cmd.name}")
-        logger.info("=============================")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Commands before clearing: %s", ", ".join(_command_paths(existing_commands)))
         
         # Clear any existing redeye commands
-        existing_commands = bot.tree.get_commands()
         for cmd in existing_commands:
             if cmd.name in ['redeye', 'redeye_help']:
                 bot.tree.remove_command(cmd.name)
-                if cmd.name in registered_commands:
-                    registered_commands.remove(cmd.name)
+                registered_commands.discard(cmd.name)
         
         # Set up profile commands
         registered_commands = await setup_profile_cmd(bot, registered_commands)
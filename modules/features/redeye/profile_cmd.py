@@ -99,8 +99,9 @@ def has_redeye_permission():
                 
                 if not has_role:
                     role_names = []
+                    get_role = interaction.guild.get_role
                     for role_id in whitelisted_roles:
-                        role = discord.utils.get(interaction.guild.roles, id=role_id)
+                        role = get_role(role_id)
                         if role:
                             role_names.append(role.name)
                     role_list = " or ".join(role_names)
@@ -120,12 +120,6 @@ async def setup(bot, registered_commands=None):
         @require_mod_role()
         async def general(interaction: discord.Interaction):
             """View bot status and configuration."""
-            # Create status embed
-            embed = discord.Embed(
-                title="Bot Status & Configuration",
-                color=int(os.getenv('EMBED_COLOR', '000000'), 16)
-            )
-            
             # Bot Info
             bot_info = (
                 f"**Latency:** {round(bot.latency * 1000)}ms\n"
@@ -133,14 +127,12 @@ async def setup(bot, registered_commands=None):
                 f"**Development Mode:** {os.getenv('DEVELOPMENT', 'false')}\n"
                 f"**Debug Mode:** {os.getenv('DEBUG', 'false')}"
             )
-            embed.add_field(name="Bot Info", value=bot_info, inline=False)
             
             # Module Status
             module_status = (
                 f"**Enabled Modules:** {', '.join(os.getenv('ENABLED_MODULES', '').split(','))}\n"
                 f"**Loaded Submodules:** {', '.join(loaded_submodules)}"
             )
-            embed.add_field(name="Module Status", value=module_status, inline=False)
             
             # Mod Configuration
             mod_config = (
@@ -148,7 +140,17 @@ async def setup(bot, registered_commands=None):
                 f"**Command Cooldown:** {os.getenv('COMMAND_COOLDOWN', '3')}s\n"
                 f"**Rate Limit:** {os.getenv('MAX_COMMANDS_PER_MINUTE', '60')} commands/minute"
             )
-            embed.add_field(name="Mod Configuration", value=mod_config, inline=False)
+            
+            # Create status embed in one step
+            embed = discord.Embed.from_dict({
+                'title': "Bot Status & Configuration",
+                'color': int(os.getenv('EMBED_COLOR', '000000'), 16),
+                'fields': [
+                    {'name': "Bot Info", 'value': bot_info, 'inline': False},
+                    {'name': "Module Status", 'value': module_status, 'inline': False},
+                    {'name': "Mod Configuration", 'value': mod_config, 'inline': False}
+                ]
+            })
             
             await interaction.response.send_message(embed=embed, ephemeral=True)
             
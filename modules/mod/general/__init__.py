@@ -37,26 +37,24 @@ async def setup(bot):
             )
             return
         
-        # Create status embed
-        embed = discord.Embed(
-            title="Bot Status & Configuration",
-            color=int(os.getenv('EMBED_COLOR', '000000'), 16)
-        )
-        
-        # Add bot info
-        embed.add_field(
-            name="Bot Info",
-            value=f"Latency: {round(bot.latency * 1000)}ms\nGuilds: {len(bot.guilds)}",
-            inline=False
-        )
-        
-        # Add enabled modules
+        # Create status embed in one step from its fields
         enabled_modules = os.getenv('ENABLED_MODULES', '').split(',')
-        embed.add_field(
-            name="Enabled Modules",
-            value='\n'.join(enabled_modules) if enabled_modules else "None",
-            inline=False
-        )
+        embed = discord.Embed.from_dict({
+            'title': "Bot Status & Configuration",
+            'color': int(os.getenv('EMBED_COLOR', '000000'), 16),
+            'fields': [
+                {
+                    'name': "Bot Info",
+                    'value': f"Latency: {round(bot.latency * 1000)}ms\nGuilds: {len(bot.guilds)}",
+                    'inline': False
+                },
+                {
+                    'name': "Enabled Modules",
+                    'value': '\n'.join(enabled_modules) if enabled_modules else "None",
+                    'inline': False
+                }
+            ]
+        })
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
     
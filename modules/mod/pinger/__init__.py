@@ -15,6 +15,7 @@ import discord
 from discord import app_commands
 from typing import Optional, Dict, List, Set
 from .. import require_mod_role, require_pinger_user_role
+from utils.helpers import parse_id_list, parse_keywords, parse_valid_ids
 import io
 import asyncio
 import time
@@ -137,14 +138,31 @@ def load_config():
 def save_config():
     """Save pinger configuration to file."""
     try:
-        config_path = os.path.join("data", "pinger", "config.json")
-        os.makedirs(os.path.dirname(config_path), exist_ok=True)
-        with open(config_path, 'w') as f:
-            json.dump(PINGER_CONFIG, f, indent=2)
-            logger.info("Saved pinger configuration")
+        _write_config(json.dumps(PINGER_CONFIG, indent=2))
+        logger.info("Saved pinger configuration")
     except Exception as e:
         logger.error(f"Error saving pinger config: {e}")
 
+async def save_config_async():
+    """Save pinger configuration without blocking the event loop.
+
+    The config is serialized on the loop, so handlers mutating
+    PINGER_CONFIG can't race the write; only the disk I/O runs in a thread.
+    """
+    try:
+        payload = json.dumps(PINGER_CONFIG, indent=2)
+        await asyncio.to_thread(_write_config, payload)
+        logger.info("Saved pinger configuration")
+    except Exception as e:
+        logger.error(f"Error saving pinger config: {e}")
+
+def _write_config(payload):
+    """Write serialized pinger configuration to disk."""
+    config_path = os.path.join("data", "pinger", "config.json")
+    os.makedirs(os.path.dirname(config_path), exist_ok=True)
+    with open(config_path, 'w') as f:
+        f.write(payload)
+
 async def setup(bot):
     """Set up the pinger module."""
     # Load configuration
@@ -168,7 +186,7 @@ async def setup(bot):
             
         try:
             # Split the comma-separated role IDs and convert each to int
-            role_ids = [int(role_id.strip()) for role_id in role_ids_str.split(',') if role_id.strip()]
+            role_ids = parse_id_list(role_ids_str)
             return any(role.id in role_ids for role in interaction.user.roles)
         except:
             return False
@@ -196,7 +214,7 @@ async def setup(bot):
             }
             
         # Add new keywords
-        new_keywords = [k.strip() for k in keywords.split(",")]
+        new_keywords = parse_keywords(keywords)
         user_config = PINGER_CONFIG["user_keywords"][str(user.id)]
         added = []
         
@@ -206,7 +224,7 @@ async def setup(bot):
                 added.append(keyword)
                 
         if added:
-            save_config()
+            await save_config_async()
             await interaction.response.send_message(
                 f"Added keywords for {user.mention}: {', '.join(f'`{k}`' for k in added)}",
                 ephemeral=True
@@ -237,7 +255,7 @@ async def setup(bot):
             return
             
         # Remove keywords
-        remove_keywords = [k.strip() for k in keywords.split(",")]
+        remove_keywords = parse_keywords(keywords)
         user_config = PINGER_CONFIG["user_keywords"][str(user.id)]
         removed = []
         
@@ -247,7 +265,7 @@ async def setup(bot):
                 removed.append(keyword)
                 
         if removed:
-            save_config()
+            await save_config_async()
             await interaction.response.send_message(
                 f"Removed keywords for {user.mention}: {', '.join(f'`{k}`' for k in removed)}",
                 ephemeral=True
@@ -322,7 +340,7 @@ async def setup(bot):
                 
                 for user_id, config in PINGER_CONFIG["user_keywords"].items():
                     try:
-                        member = await interaction.guild.fetch_member(int(user_id))
+                        member = interaction.guild.get_member(int(user_id)) or await interaction.guild.fetch_member(int(user_id))
                         if member and config["keywords"]:
                             embed.add_field(
                                 name=member.display_name,
@@ -372,7 +390,7 @@ async def setup(bot):
         if action == "add":
             if channel_id not in PINGER_CONFIG[config_key]:
                 PINGER_CONFIG[config_key].append(channel_id)
-                save_config()
+                await save_config_async()
                 await interaction.response.send_message(
                     f"Added {channel.mention} to {type} channels.",
                     ephemeral=True
@@ -385,7 +403,7 @@ async def setup(bot):
         else:  # remove
             if channel_id in PINGER_CONFIG[config_key]:
                 PINGER_CONFIG[config_key].remove(channel_id)
-                save_config()
+                await save_config_async()
                 await interaction.response.send_message(
                     f"Removed {channel.mention} from {type} channels.",
                     ephemeral=True
@@ -428,7 +446,7 @@ async def setup(bot):
         if action == "add":
             if channel_id not in user_config["channels"]:
                 user_config["channels"].append(channel_id)
-                save_config()
+                await save_config_async()
                 await interaction.response.send_message(
                     f"Added {channel.mention} to {user.mention}'s whitelist.",
                     ephemeral=True
@@ -441,7 +459,7 @@ async def setup(bot):
         else:  # remove
             if channel_id in user_config["channels"]:
                 user_config["channels"].remove(channel_id)
-                save_config()
+                await save_config_async()
                 await interaction.response.send_message(
                     f"Removed {channel.mention} from {user.mention}'s whitelist.",
                     ephemeral=True
@@ -568,7 +586,7 @@ async def setup(bot):
                 }
             
             # Add new keywords
-            new_keywords = [k.strip() for k in keywords.split(",")]
+            new_keywords = parse_keywords(keywords)
             user_config = PINGER_CONFIG["user_keywords"][user_id]
             added = []
             
@@ -578,7 +596,7 @@ async def setup(bot):
                     added.append(keyword)
                     
             if added:
-                save_config()
+                await save_config_async()
                 await interaction.response.send_message(
                     f"Added keywords: {', '.join(f'`{k}`' for k in added)}",
                     ephemeral=True
@@ -608,7 +626,7 @@ async def setup(bot):
                 return
             
             # Remove keywords
-            remove_keywords = [k.strip() for k in keywords.split(",")]
+            remove_keywords = parse_keywords(keywords)
             user_config = PINGER_CONFIG["user_keywords"][user_id]
             removed = []
             
@@ -618,7 +636,7 @@ async def setup(bot):
                     removed.append(keyword)
                     
             if removed:
-                save_config()
+                await save_config_async()
                 await interaction.response.send_message(
                     f"Removed keywords: {', '.join(f'`{k}`' for k in removed)}",
                     ephemeral=True
@@ -699,7 +717,7 @@ async def setup(bot):
                 
             # Add channel to whitelist
             user_config["channels"].append(channel.id)
-            save_config()
+            await save_config_async()
             
             await interaction.response.send_message(
                 f"Added {channel.mention} to your keyword channel whitelist.",
@@ -735,7 +753,7 @@ async def setup(bot):
                 
             # Remove channel from whitelist
             user_config["channels"].remove(channel.id)
-            save_config()
+            await save_config_async()
             
             await interaction.response.send_message(
                 f"Removed {channel.mention} from your keyword channel whitelist.",
@@ -769,7 +787,7 @@ async def setup(bot):
                 
             # Clear the channel whitelist
             user_config["channels"] = []
-            save_config()
+            await save_config_async()
             
             await interaction.response.send_message(
                 "Cleared your channel whitelist. Your keywords will now be monitored in all channels.",
@@ -789,7 +807,7 @@ async def setup(bot):
     # Add a structure for forwarding rules
     if "forwarding_rules" not in PINGER_CONFIG:
         PINGER_CONFIG["forwarding_rules"] = []
-        save_config()
+        await save_config_async()
     
     @forward_group.command(name="add_channel_rule")
     @app_commands.describe(
@@ -807,12 +825,7 @@ async def setup(bot):
         """Add a forwarding rule for specific channels."""
         try:
             # Parse channel IDs
-            channel_ids = []
-            for channel_id in channels.split(','):
-                try:
-                    channel_ids.append(int(channel_id.strip()))
-                except ValueError:
-                    continue
+            channel_ids = parse_valid_ids(channels)
             
             if not channel_ids:
                 await interaction.response.send_message(
@@ -822,7 +835,7 @@ async def setup(bot):
                 return
             
             # Parse keywords
-            keyword_list = [k.strip() for k in keywords.split(',') if k.strip()]
+            keyword_list = parse_keywords(keywords)
             if not keyword_list:
                 await interaction.response.send_message(
                     "❌ No valid keywords provided.",
@@ -869,7 +882,7 @@ async def setup(bot):
             
             # Add rule to configuration
             PINGER_CONFIG["forwarding_rules"].append(rule)
-            save_config()
+            await save_config_async()
             
             # Create response embed
             embed = discord.Embed(
@@ -942,7 +955,7 @@ async def setup(bot):
                 return
             
             # Parse keywords
-            keyword_list = [k.strip() for k in keywords.split(',') if k.strip()]
+            keyword_list = parse_keywords(keywords)
             if not keyword_list:
                 await interaction.response.send_message(
                     "❌ No valid keywords provided.",
@@ -951,22 +964,10 @@ async def setup(bot):
                 return
             
             # Parse blacklisted channels
-            blacklist_ids = []
-            if blacklist_channels:
-                for channel_id in blacklist_channels.split(','):
-                    try:
-                        blacklist_ids.append(int(channel_id.strip()))
-                    except ValueError:
-                        continue
+            blacklist_ids = parse_valid_ids(blacklist_channels)
                         
             # Parse blacklisted rooms
-            blacklist_room_ids = []
-            if blacklist_rooms:
-                for room_id in blacklist_rooms.split(','):
-                    try:
-                        blacklist_room_ids.append(int(room_id.strip()))
-                    except ValueError:
-                        continue
+            blacklist_room_ids = parse_valid_ids(blacklist_rooms)
             
             # Validate target channel
             try:
@@ -1011,7 +1012,7 @@ async def setup(bot):
             
             # Add rule to configuration
             PINGER_CONFIG["forwarding_rules"].append(rule)
-            save_config()
+            await save_config_async()
             
             # Create response embed
             embed = discord.Embed(
@@ -1143,7 +1144,7 @@ async def setup(bot):
             
         # Get the rule and remove it
         rule = PINGER_CONFIG["forwarding_rules"].pop(rule_number - 1)
-        save_config()
+        await save_config_async()
         
         # Create a response embed
         embed = discord.Embed(
@@ -1320,15 +1321,13 @@ async def setup(bot):
                             if (field.name and re.search(rf"\b{re.escape(keyword)}\b", field.name, re.IGNORECASE)) or \
                                (field.value and re.search(rf"\b{re.escape(keyword)}\b", field.value, re.IGNORECASE)):
                                 match_found = True
+                                content_parts = []
                                 if embed.title:
-                                    matched_content = f"**{embed.title}**\n"
-                                else:
-                                    matched_content = ""
-                                    
+                                    content_parts.append(f"**{embed.title}**")
                                 if embed.description:
-                                    matched_content += f"{embed.description}\n"
-                                    
-                                matched_content += f"**{field.name}**: {field.value}"
+                                    content_parts.append(embed.description)
+                                content_parts.append(f"**{field.name}**: {field.value}")
+                                matched_content = "\n".join(content_parts)
                                 matched_location = f"embed.field ({embed_index}.{field_index})"
                                 break
                                 
@@ -1357,7 +1356,7 @@ async def setup(bot):
                         
                         # Get the user to notify
                         try:
-                            user = await message.guild.fetch_member(int(user_id))
+                            user = message.guild.get_member(int(user_id)) or await message.guild.fetch_member(int(user_id))
                             if not user:
                                 logger.warning(f"Could not find user with ID {user_id} in guild {message.guild.id}")
                                 continue
@@ -1425,14 +1424,12 @@ async def setup(bot):
                             logger.error(f"Error sending notification: {str(e)}")
                                 
                     except Exception as e:
-                        logger.error(f"Error sending notification: {str(e)}")
-                        import traceback
-                        logger.error(traceback.format_exc())
+                        logger.exception("Error sending notification: %s", e)
 
 async def teardown(bot):
     """Clean up the pinger module."""
     # Save configuration
-    save_config()
+    await save_config_async()
     logger.info("Saved pinger configuration")
 
 async def process_forwarding_rules(bot, message):
@@ -1559,15 +1556,13 @@ async def process_forwarding_rules(bot, message):
                                    (field.value and keyword.lower() in field.value.lower()):
                                     keyword_match = True
                                     matched_keyword = keyword
+                                    content_parts = []
                                     if embed.title:
-                                        matched_content = f"**{embed.title}**\n"
-                                    else:
-                                        matched_content = ""
-                                        
+                                        content_parts.append(f"**{embed.title}**")
                                     if embed.description:
-                                        matched_content += f"{embed.description}\n"
-                                        
-                                    matched_content += f"**{field.name}**: {field.value}"
+                                        content_parts.append(embed.description)
+                                    content_parts.append(f"**{field.name}**: {field.value}")
+                                    matched_content = "\n".join(content_parts)
                                     break
                             if keyword_match:
                                 break
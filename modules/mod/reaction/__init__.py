@@ -10,6 +10,7 @@ critical:
 import os
 import logging
 import discord
+from utils.helpers import parse_id_list
 
 logger = logging.getLogger('discord_bot.mod.reaction')
 
@@ -39,7 +40,7 @@ def get_whitelisted_categories():
     if not category_ids_str:
         return []
     try:
-        categories = [int(cat_id.strip()) for cat_id in category_ids_str.split(",") if cat_id.strip()]
+        categories = parse_id_list(category_ids_str)
         logger.info(f"Parsed whitelisted categories: {categories}")
         return categories
     except (ValueError, TypeError) as e:
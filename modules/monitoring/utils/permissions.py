@@ -8,13 +8,14 @@ import os
 import logging
 import discord
 from discord import app_commands
+from utils.helpers import parse_id_list
 
 logger = logging.getLogger(__name__)
 
 def get_monitoring_whitelist_roles():
     """Get the list of whitelisted role IDs for monitoring commands."""
     role_ids_str = os.getenv('MONITORING_WHITELIST_ROLE_IDS', '')
-    return [int(id.strip()) for id in role_ids_str.split(',') if id.strip()]
+    return parse_id_list(role_ids_str)
 
 def require_monitoring_role():
     """
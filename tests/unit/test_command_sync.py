@@ -0,0 +1,93 @@
+"""
+Unit tests for command synchronization.
+"""
+import pytest
+from collections import defaultdict
+from unittest.mock import AsyncMock, MagicMock, patch
+import core.command_sync as command_sync_module
+from core.command_sync import CommandSync, SyncRateLimiter
+
+def make_bot(application_id):
+    """Build a mock bot whose on_ready listener can be fired directly."""
+    bot = MagicMock()
+    bot.application_id = application_id
+    bot.tree.sync = AsyncMock(return_value=[])
+    bot.tree.get_commands.return_value = []
+    bot.listeners = {}
+    bot.add_listener = lambda func, name: bot.listeners.setdefault(name, func)
+    return bot
+
+def make_command(name, description="A command"):
+    """Build a mock command with a fixed payload."""
+    command = MagicMock()
+    command.name = name
+    command.to_dict.return_value = {'name': name, 'description': description}
+    return command
+
+@pytest.mark.unit
+class TestCommandSync:
+    """Test suite for syncing several bots through one CommandSync."""
+
+    @pytest.fixture(autouse=True)
+    def production(self, monkeypatch):
+        """Sync globally, with fresh rate limiters for every test."""
+        monkeypatch.setattr(command_sync_module, 'sync_rate_limiters', defaultdict(SyncRateLimiter))
+        with patch.object(command_sync_module, 'is_development', return_value=False):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_each_bot_syncs_its_own_application(self):
+        """Test that one bot's cooldown doesn't skip another bot's sync."""
+        sync = CommandSync()
+        first, second = make_bot(1), make_bot(2)
+        sync.sync_on_ready(first, 'first')
+        sync.sync_on_ready(second, 'second')
+
+        await first.listeners['on_ready']()
+        await second.listeners['on_ready']()
+
+        first.tree.sync.assert_awaited_once_with(guild=None)
+        second.tree.sync.assert_awaited_once_with(guild=None)
+        assert sync._sync_done == {'first', 'second'}
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_per_application(self):
+        """Test that a rate limit on one application doesn't block another."""
+        sync = CommandSync()
+        first, second = make_bot(1), make_bot(2)
+        command_sync_module.sync_rate_limiters[1].block_for(3600)
+
+        assert await sync.sync_commands(second)
+        second.tree.sync.assert_awaited_once()
+        first.tree.sync.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_syncs_only_when_tree_changes(self, monkeypatch):
+        """Test that an unchanged tree is skipped and a changed one is sent."""
+        monkeypatch.setattr(command_sync_module, 'SYNC_COOLDOWN', 0)
+        sync = CommandSync()
+        bot = make_bot(1)
+        bot.tree.get_commands.return_value = [make_command('ping')]
+
+        assert await sync.sync_commands(bot)
+        assert await sync.sync_commands(bot)
+        assert bot.tree.sync.await_count == 1
+
+        bot.tree.get_commands.return_value = [make_command('ping', "Changed")]
+        assert await sync.sync_commands(bot)
+        assert bot.tree.sync.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_resync_sends_unchanged_tree(self, monkeypatch):
+        """Test that resync() forces a sync even if the tree is unchanged."""
+        monkeypatch.setattr(command_sync_module, 'SYNC_COOLDOWN', 0)
+        sync = CommandSync()
+        bot = make_bot(1)
+        sync.sync_on_ready(bot, 'main')
+
+        await bot.listeners['on_ready']()
+        sync.resync('main')
+        await bot.listeners['on_ready']()
+
+        assert bot.tree.sync.await_count == 2
+        assert 'main' in sync._sync_done
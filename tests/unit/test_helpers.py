@@ -0,0 +1,64 @@
+"""
+path: tests/unit/test_helpers.py
+purpose: Unit tests for the helper utilities
+critical:
+- Test ID list parsing
+- Test lenient ID parsing
+- Test edge cases and error conditions
+"""
+
+import pytest
+from utils.helpers import parse_id_list, parse_keywords, parse_valid_ids
+
+@pytest.mark.unit
+class TestParseIdList:
+    """Test suite for comma-separated ID parsing."""
+    
+    def test_parses_ids(self):
+        """Test parsing a plain comma-separated list."""
+        assert parse_id_list("123,456,789") == [123, 456, 789]
+        
+    def test_ignores_whitespace_and_empty_entries(self):
+        """Test that surrounding whitespace and empty entries are skipped."""
+        assert parse_id_list(" 123 , ,456,  ,") == [123, 456]
+        assert parse_id_list("") == []
+        
+    def test_invalid_entry_raises(self):
+        """Test that a non-numeric entry raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_id_list("123,abc")
+
+@pytest.mark.unit
+class TestParseValidIds:
+    """Test suite for lenient comma-separated ID parsing."""
+    
+    def test_parses_ids(self):
+        """Test parsing a list with surrounding whitespace."""
+        assert parse_valid_ids(" 123 , 456,789 ") == [123, 456, 789]
+
+    def test_ignores_any_whitespace(self):
+        """Test that tabs and newlines are removed along with spaces."""
+        assert parse_valid_ids("123,\t456,\n789") == [123, 456, 789]
+
+    def test_skips_entries_with_internal_whitespace(self):
+        """Test that an entry with internal whitespace is dropped, not merged."""
+        assert parse_valid_ids("123 456,789") == [789]
+
+    def test_skips_invalid_entries(self):
+        """Test that empty and non-numeric entries are dropped."""
+        assert parse_valid_ids("123,abc,,4x5,678") == [123, 678]
+        assert parse_valid_ids("") == []
+        assert parse_valid_ids(None) == []
+
+@pytest.mark.unit
+class TestParseKeywords:
+    """Test suite for comma-separated keyword parsing."""
+    
+    def test_parses_keywords(self):
+        """Test parsing a list with surrounding whitespace and empty entries."""
+        assert parse_keywords(" jordan , dunk,, yeezy ") == ["jordan", "dunk", "yeezy"]
+        assert parse_keywords("") == []
+        
+    def test_quoted_keywords(self):
+        """Test that quoted keywords may contain commas."""
+        assert parse_keywords('"air max 1, og", dunk') == ["air max 1, og", "dunk"]
@@ -144,6 +144,25 @@ class TestPermissionSystem:
         permission_manager.revoke_role_permission(mock_role.id, permission.name)
         assert not permission_manager.has_permission(mock_member, permission.name)
         
+    def test_permission_cache_expiry(self, permission_manager, mock_member, mock_role):
+        """Test that cached checks expire so role changes are picked up."""
+        # Setup
+        permission = Permission("test.permission", "Test permission")
+        permission_manager.register_permission(permission)
+        permission_manager.assign_role_permission(mock_role.id, permission.name)
+        mock_member.roles = [mock_role]
+        
+        with patch("core.permissions.time.monotonic", return_value=1000.0):
+            assert permission_manager.has_permission(mock_member, permission.name)
+            
+            # Role removed: cached result is still served within the TTL
+            mock_member.roles = []
+            assert permission_manager.has_permission(mock_member, permission.name)
+            
+        # Test
+        with patch("core.permissions.time.monotonic", return_value=1031.0):
+            assert not permission_manager.has_permission(mock_member, permission.name)
+        
     def test_permission_conflicts(self, permission_manager, mock_member):
         """Test handling of permission conflicts between roles."""
         # Setup
@@ -5,10 +5,14 @@ This module provides common helper functions for the Discord bot.
 """
 
 import re
+import csv
+import logging
 import discord
 from discord.ext import commands
 from config.features.embed_config import embed as embed_config
 
+logger = logging.getLogger('discord_bot.utils.helpers')
+
 def is_admin(ctx):
     """
     Check if a user has administrator permissions.
@@ -62,6 +66,57 @@ def format_time(seconds):
     
     return " ".join(time_parts)
 
+def parse_id_list(value):
+    """
+    Parse a comma-separated list of Discord IDs.
+    
+    Each token is parsed once; int() already ignores surrounding whitespace.
+    
+    Args:
+        value (str): The comma-separated IDs
+    
+    Returns:
+        list: The parsed IDs, skipping empty entries
+    
+    Raises:
+        ValueError: If any entry is not a valid integer
+    """
+    return [int(token) for token in value.split(',') if token and not token.isspace()]
+
+def parse_valid_ids(value):
+    """
+    Parse a comma-separated list of Discord IDs, skipping invalid entries.
+    
+    Only whitespace around each entry is stripped, so an entry with
+    internal whitespace is invalid rather than merged into another ID.
+    
+    Args:
+        value (str): The comma-separated IDs
+    
+    Returns:
+        list: The parsed IDs; empty or non-numeric entries are dropped
+    """
+    if not value:
+        return []
+    return [int(token) for token in map(str.strip, value.split(',')) if token.isdecimal()]
+
+def parse_keywords(value):
+    """
+    Parse a comma-separated list of keywords.
+    
+    Keywords may be wrapped in double quotes to include commas.
+    
+    Args:
+        value (str): The comma-separated keywords
+    
+    Returns:
+        list: The keywords with surrounding whitespace removed, skipping empty entries
+    """
+    if not value:
+        return []
+    row = next(csv.reader([value], skipinitialspace=True), [])
+    return [keyword for keyword in map(str.strip, row) if keyword]
+
 def clean_text(text):
     """
     Clean text by removing mentions, links, and excessive whitespace.
@@ -114,8 +169,6 @@ async def send_error_embed(interaction, error_message, title="Error", ephemeral=
             await interaction.response.send_message(embed=embed, ephemeral=ephemeral)
         return True
     except Exception as e:
-        import logging
-        logger = logging.getLogger('discord_bot.utils.helpers')
         logger.error(f"Failed to send error response: {e}")
         return False
 
@@ -13,6 +13,7 @@ from discord import Interaction, Member, User
 from discord.ext import commands
 from discord import app_commands
 from core.permissions import permission_manager, Permission
+from utils.helpers import parse_id_list
 
 logger = logging.getLogger('discord_bot.utils.permissions')
 
@@ -41,7 +42,7 @@ def get_whitelisted_roles(module_name: str) -> List[int]:
     
     try:
         # Parse comma-separated role IDs into integers
-        role_ids = [int(role_id.strip()) for role_id in role_ids_str.split(',') if role_id.strip()]
+        role_ids = parse_id_list(role_ids_str)
         
         # Register these roles with the permission system
         permission_name = MODULE_PERMISSIONS.get(module_name.lower())
@@ -71,19 +72,19 @@ def has_module_permission(user: Union[Member, User], module_name: str) -> bool:
     """
     # Server owners always have all permissions
     if hasattr(user, 'guild') and user.guild and user.id == user.guild.owner_id:
-        logger.debug(f"User {user} is the server owner, granting all permissions")
+        logger.debug("User %s is the server owner, granting all permissions", user)
         return True
         
     # If we have a discord.User instead of a Member, we can't check roles
     if not isinstance(user, Member):
-        logger.debug(f"User {user} is not a Member, can't check roles")
+        logger.debug("User %s is not a Member, can't check roles", user)
         return False
         
     # Check permission using the new system
     permission_name = MODULE_PERMISSIONS.get(module_name.lower())
     if permission_name:
         has_permission = permission_manager.has_permission(user, permission_name)
-        logger.debug(f"Permission check for {user} on {module_name}: {has_permission}")
+        logger.debug("Permission check for %s on %s: %s", user, module_name, has_permission)
         return has_permission
         
     # Fallback to old system if module not registered in new system
@@ -93,12 +94,12 @@ def has_module_permission(user: Union[Member, User], module_name: str) -> bool:
         return False
         
     user_role_ids = {role.id for role in user.roles}
-    has_permission = any(role_id in user_role_ids for role_id in whitelisted_roles)
+    has_permission = not user_role_ids.isdisjoint(whitelisted_roles)
     
     if has_permission:
-        logger.debug(f"User {user} has permission for module {module_name} (legacy check)")
+        logger.debug("User %s has permission for module %s (legacy check)", user, module_name)
     else:
-        logger.debug(f"User {user} does not have permission for module {module_name} (legacy check)")
+        logger.debug("User %s does not have permission for module %s (legacy check)", user, module_name)
         
     return has_permission
 
@@ -9,9 +9,13 @@ critical:
 
 import os
 import sys
+import json
+import asyncio
+import hashlib
 import logging
 from logging.handlers import RotatingFileHandler
 import discord
+from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
 from core.error_handler import ErrorHandler, ConfigurationError
@@ -67,10 +71,34 @@ try:
     APPLICATION_ID = env_vars['APPLICATION_ID']
     GUILD_IDS = [int(id) for id in os.getenv('GUILD_IDS', '').split(',') if id]
     ENABLED_MODULES = os.getenv('ENABLED_MODULES', 'mod,online').split(',')
+    FORCE_COMMAND_SYNC = os.getenv('FORCE_COMMAND_SYNC', 'false').lower() in ('true', '1', 't')
 except Exception as e:
     logger.error(f"Failed to load configuration: {e}")
     sys.exit(1)
 
+# Hash of the command tree last synced to each guild, used to skip unchanged syncs
+COMMAND_SYNC_STATE_PATH = os.path.join('data', 'command_sync_state.json')
+
+def load_command_sync_state():
+    """Load the command tree hashes from the last successful syncs."""
+    try:
+        with open(COMMAND_SYNC_STATE_PATH, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read command sync state: {e}")
+        return {}
+
+def save_command_sync_state(state):
+    """Persist the command tree hashes of the last successful syncs."""
+    try:
+        os.makedirs(os.path.dirname(COMMAND_SYNC_STATE_PATH), exist_ok=True)
+        with open(COMMAND_SYNC_STATE_PATH, 'w') as f:
+            json.dump(state, f, indent=2)
+    except OSError as e:
+        logger.warning(f"Could not save command sync state: {e}")
+
 class DiscordBot(commands.Bot):
     """Custom Discord bot class."""
     
@@ -88,6 +116,9 @@ class DiscordBot(commands.Bot):
         # Initialize error handler
         self.error_handler = ErrorHandler(self)
         
+        # Commands synced to each guild: guild_id -> {'tuple': commands, 'by_name': {name: command}}
+        self.synced_commands = {}
+        
     async def setup_hook(self):
         """Set up the bot's modules and sync commands."""
         # Load enabled modules
@@ -113,28 +144,77 @@ class DiscordBot(commands.Bot):
             except Exception as e:
                 logger.error(f"Error loading module {module_name}: {e}")
                 
-        # Sync commands to development guilds
+        # Sync commands to development guilds, skipping guilds whose tree is unchanged
+        sync_state = load_command_sync_state()
         for guild_id in GUILD_IDS:
             try:
                 guild = discord.Object(id=guild_id)
                 self.tree.copy_global_to(guild=guild)
+                await asyncio.sleep(0)  # Let other tasks run between per-guild tree copies
+                tree_hash = self.command_tree_hash(guild)
+                if not FORCE_COMMAND_SYNC and sync_state.get(str(guild_id)) == tree_hash:
+                    logger.info(f"Commands unchanged for development guild {guild_id}, skipping sync")
+                    self.synced_commands[guild_id] = self.snapshot_commands(guild)
+                    continue
+                    
                 synced = await self.tree.sync(guild=guild)
+                sync_state[str(guild_id)] = tree_hash
+                save_command_sync_state(sync_state)
                 logger.info(f"Synced commands to development guild: {guild_id}")
                 
+                # Walk the command tree once and keep the result
+                snapshot = self.snapshot_commands(guild)
+                self.synced_commands[guild_id] = snapshot
+                cmds = snapshot['tuple']
+                
                 # Log all synced commands and their structure
-                logger.info("=== Synced Command Structure ===")
-                for cmd in self.tree.get_commands(guild=guild):
-                    logger.info(f"Command: /{cmd.name}")
-                    if hasattr(cmd, 'commands'):  # Group command
-                        for subcmd in cmd.commands:
-                            logger.info(f"  ├─ /{cmd.name} {subcmd.name}")
-                            if hasattr(subcmd, 'commands'):  # Nested group
-                                for nested_cmd in subcmd.commands:
-                                    logger.info(f"  │  └─ /{cmd.name} {subcmd.name} {nested_cmd.name}")
-                logger.info("===============================")
-            except Exception as e:
-                logger.error(f"Error syncing commands to guild {guild_id}: {e}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("=== Synced Command Structure (%d commands) ===", len(cmds))
+                    for cmd in cmds:
+                        logger.info("Command: /%s", cmd.name)
+                        for subcmd in getattr(cmd, 'commands', ()):  # Group command
+                            logger.info("  ├─ /%s %s", cmd.name, subcmd.name)
+                            for nested_cmd in getattr(subcmd, 'commands', ()):  # Nested group
+                                logger.info("  │  └─ /%s %s %s", cmd.name, subcmd.name, nested_cmd.name)
+                    logger.info("===============================")
+            except (discord.HTTPException, app_commands.AppCommandError, asyncio.TimeoutError,
+                    ValueError, TypeError) as e:
+                # Keep syncing the remaining guilds; cancellation still propagates
+                logger.exception("Error syncing commands to guild %s: %s", guild_id, e)
                 
+    def snapshot_commands(self, guild):
+        """
+        Take an immutable snapshot of a guild's commands.
+        
+        Args:
+            guild: The guild whose commands to snapshot
+            
+        Returns:
+            dict: The commands as a tuple and indexed by name
+        """
+        cmds = tuple(self.tree.get_commands(guild=guild))
+        return {'tuple': cmds, 'by_name': {cmd.name: cmd for cmd in cmds}}
+        
+    def command_tree_hash(self, guild):
+        """
+        Hash the payload of every command that would be synced to a guild.
+        
+        Args:
+            guild: The guild whose commands to hash
+            
+        Returns:
+            str: Hex digest of the command payloads
+        """
+        payloads = []
+        for cmd in self.tree.get_commands(guild=guild):
+            try:
+                payloads.append(cmd.to_dict(self.tree))
+            except TypeError:  # discord.py < 2.4 takes no tree argument
+                payloads.append(cmd.to_dict())
+        payloads.sort(key=lambda payload: (payload.get('type', 1), payload['name']))
+        encoded = json.dumps(payloads, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+        
     async def on_ready(self):
         """Called when the bot is ready."""
         logger.info(f"Logged in as {self.user} ({self.user.id})")